@@ -1,33 +1,119 @@
 import sys
 import json
 import os
+import time
+import hashlib
+from datetime import datetime
+from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
-    QHBoxLayout, QMessageBox, QGraphicsDropShadowEffect, QFrame, QStackedLayout,
-    QTextEdit, QCheckBox
+    QHBoxLayout, QMessageBox, QFrame, QStackedLayout,
+    QCheckBox
 )
-from PyQt5.QtGui import QFont, QPixmap, QPalette, QColor, QPainter, QBrush, QLinearGradient, QPen
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty, QPointF, pyqtSignal, QThread
-import requests
+from PyQt5.QtGui import QFont, QPixmap, QPalette, QColor, QPainter, QBrush, QLinearGradient, QPen, QPolygon
+from PyQt5.QtCore import (
+    Qt, QTimer, QBasicTimer, QPropertyAnimation, QEasingCurve, pyqtProperty, QPointF, QRect, pyqtSignal,
+    QEvent, QObject, QRunnable, QThreadPool
+)
+import numpy as np
+
+# orjson is optional; fall back to the stdlib json module for config I/O
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+# numba is optional; it only pays off for much larger particle counts
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    GEMINI_AVAILABLE = False
-    print("Warning: google-generativeai not installed. API validation will be simulated.")
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def step_particles(particles, width, height):
+        """Advance and bounce every particle in one compiled pass over the x, y, vx, vy columns"""
+        for i in range(particles.shape[0]):
+            particles[i, 0] += particles[i, 2]
+            particles[i, 1] += particles[i, 3]
+            if particles[i, 0] < 0 or particles[i, 0] > width:
+                particles[i, 2] = -particles[i, 2]
+            if particles[i, 1] < 0 or particles[i, 1] > height:
+                particles[i, 3] = -particles[i, 3]
+
+def dumps_config(config):
+    """Serialize the config dict to compact UTF-8 bytes (the file is only machine-read)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(config)
+    return json.dumps(config, separators=(',', ':')).encode()
+
+def loads_config(data):
+    """Parse config bytes back into a dict"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def read_config(path):
+    """Read a config file; returns an empty dict if it is missing or unreadable"""
+    try:
+        return loads_config(Path(path).read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error loading config: {e}")
+    return {}
 
-class APIValidationThread(QThread):
-    validation_complete = pyqtSignal(bool, str)
+def write_config(path, data):
+    """Write serialized config bytes via a temp file so a crash never leaves a torn file"""
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    # A buffered file object retries short writes until every byte is out
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def hash_api_key(api_key):
+    """Hash an API key so validation results can be remembered without keeping the key around"""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+class APIValidationSignals(QObject):
+    # Each carries the key that was checked, so a later edit to the input can't be saved as valid
+    validation_complete = pyqtSignal(str, bool, str)
+    simulation_complete = pyqtSignal(str, bool, str)
+
+class APIValidationTask(QRunnable):
+    """Validates an API key on the global thread pool, reporting through APIValidationSignals"""
+    
+    # google-generativeai is imported on first validation and shared by later tasks
+    _genai = None
+    _probed = False
     
-    def __init__(self, api_key):
+    def __init__(self, api_key, signals):
         super().__init__()
         self.api_key = api_key
+        self.signals = signals
+    
+    @classmethod
+    def load_genai(cls):
+        """Import google-generativeai lazily, returning None if it is not installed"""
+        if not cls._probed:
+            cls._probed = True
+            try:
+                import google.generativeai as genai
+                cls._genai = genai
+            except ImportError:
+                print("Warning: google-generativeai not installed. API validation will be simulated.")
+        return cls._genai
     
     def run(self):
         """Validate the API key with actual Gemini API"""
         try:
-            if GEMINI_AVAILABLE and self.api_key:
+            genai = self.load_genai()
+            if genai and self.api_key:
                 # Configure the API
                 genai.configure(api_key=self.api_key)
                 
@@ -36,96 +122,401 @@ class APIValidationThread(QThread):
                 response = model.generate_content("Hello")
                 
                 if response and response.text:
-                    self.validation_complete.emit(True, "API key validated successfully")
+                    self.signals.validation_complete.emit(self.api_key, True, "API key validated successfully")
                 else:
-                    self.validation_complete.emit(False, "Invalid response from API")
+                    self.signals.validation_complete.emit(self.api_key, False, "Invalid response from API")
                     
             else:
-                # Simulate validation if Gemini is not available
-                import time
-                time.sleep(2)
+                # Simulate validation if Gemini is not available; the delay is
+                # applied on the GUI side so no pool thread sits sleeping
                 if len(self.api_key) > 20:
-                    self.validation_complete.emit(True, "API key format appears valid (simulation mode)")
+                    self.signals.simulation_complete.emit(self.api_key, True, "API key format appears valid (simulation mode)")
                 else:
-                    self.validation_complete.emit(False, "API key format appears invalid")
+                    self.signals.simulation_complete.emit(self.api_key, False, "API key format appears invalid")
                     
         except Exception as e:
             error_msg = str(e).lower()
             if "api_key" in error_msg or "invalid" in error_msg:
-                self.validation_complete.emit(False, "Invalid API key")
+                self.signals.validation_complete.emit(self.api_key, False, "Invalid API key")
             elif "quota" in error_msg or "limit" in error_msg:
-                self.validation_complete.emit(False, "API quota exceeded")
+                self.signals.validation_complete.emit(self.api_key, False, "API quota exceeded")
             elif "permission" in error_msg:
-                self.validation_complete.emit(False, "API permission denied")
+                self.signals.validation_complete.emit(self.api_key, False, "API permission denied")
             else:
-                self.validation_complete.emit(False, f"Validation error: {str(e)}")
+                self.signals.validation_complete.emit(self.api_key, False, f"Validation error: {str(e)}")
+
+class ConfigLoaderSignals(QObject):
+    config_loaded = pyqtSignal(dict)
+    config_saved = pyqtSignal(dict)
+    config_save_failed = pyqtSignal(str)
+
+class ConfigLoader(QRunnable):
+    """Reads the config file on the global thread pool and reports back via signals"""
+    def __init__(self, path, signals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+    
+    def run(self):
+        self.signals.config_loaded.emit(read_config(self.path))
+
+class ConfigWriter(QRunnable):
+    """Writes the config file on the global thread pool so the GUI never waits on disk"""
+    def __init__(self, path, config, signals):
+        super().__init__()
+        self.path = path
+        self.config = config
+        self.data = dumps_config(config)
+        self.signals = signals
+    
+    def run(self):
+        try:
+            write_config(self.path, self.data)
+            self.signals.config_saved.emit(self.config)
+        except Exception as e:
+            self.signals.config_save_failed.emit(str(e))
+
+SIGN_BIT = np.uint32(0x80000000)
 
 class AnimatedBackground(QWidget):
+    OPACITY_TIERS = 8
+    ACTIVE_INTERVAL = 50
+    INACTIVE_INTERVAL = 200
+    NUMBA_MIN_PARTICLES = 1000
+    _tier_pens = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.particles = []
         self.init_particles(100)
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_particles)
-        self.timer.start(50)
+        # One 2px pen per opacity tier so each tier is a single drawPoints call;
+        # built once and shared by every background instance
+        if AnimatedBackground._tier_pens is None:
+            AnimatedBackground._tier_pens = [
+                QPen(QColor(0, 247, 255, int((tier + 0.5) / self.OPACITY_TIERS * 255)), 2)
+                for tier in range(self.OPACITY_TIERS)
+            ]
+        self.tier_pens = AnimatedBackground._tier_pens
+        self.bg_pixmap = None
+        
+        # QBasicTimer delivers straight to timerEvent, no signal/slot dispatch per tick
+        self.timer = QBasicTimer()
+        self.interval = self.ACTIVE_INTERVAL
+    
+    def timerEvent(self, event):
+        if event.timerId() == self.timer.timerId():
+            self.update_particles()
+        else:
+            super().timerEvent(event)
+    
+    def showEvent(self, event):
+        self.timer.start(self.interval, self)
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+    
+    def changeEvent(self, event):
+        # Slow the animation down while the window is in the background
+        if event.type() == QEvent.ActivationChange:
+            self.interval = self.ACTIVE_INTERVAL if self.isActiveWindow() else self.INACTIVE_INTERVAL
+            if self.timer.isActive():
+                self.timer.start(self.interval, self)
+        super().changeEvent(event)
     
     def init_particles(self, count):
-        import random
-        for _ in range(count):
-            self.particles.append({
-                "x": random.randint(0, 800),
-                "y": random.randint(0, 600),
-                "vx": random.uniform(-0.5, 0.5),
-                "vy": random.uniform(-0.5, 0.5),
-                "opacity": random.uniform(0.1, 0.8)
-            })
+        """Allocate particle state as one contiguous float32 buffer of x, y, vx, vy, opacity"""
+        self.count = count
+        self.particles = np.empty((count, 5), dtype=np.float32)
+        self.particles[:, 0:2] = np.random.uniform(0, [800, 600], (count, 2))
+        self.particles[:, 2:4] = np.random.uniform(-0.5, 0.5, (count, 2))
+        self.particles[:, 4] = np.random.uniform(0.1, 0.8, count)
+        
+        # Column views into the buffer; updating them writes through in place
+        self.pos = self.particles[:, 0:2]
+        self.vel = self.particles[:, 2:4]
+        self.opacity = self.particles[:, 4]
+        # Same memory as vel reinterpreted as raw bits, for sign-flip bounces
+        self.vel_bits = self.vel.view(np.uint32)
+        self.tiers = self.opacity_tiers(self.opacity)
+        self.group_tiers()
+        
+        # The fused kernel only beats vectorized NumPy once there are enough particles
+        self.use_numba = NUMBA_AVAILABLE and count >= self.NUMBA_MIN_PARTICLES
+        if self.use_numba:
+            step_particles(self.particles[:1].copy(), 1.0, 1.0)  # compile / load cache up front
+    
+    def group_tiers(self):
+        """Sort particle indices by tier so each tier's points are one contiguous slice"""
+        self.tier_order = np.argsort(self.tiers, kind='stable')
+        self.tier_bounds = np.searchsorted(self.tiers[self.tier_order], np.arange(self.OPACITY_TIERS + 1))
+    
+    def opacity_tiers(self, opacity):
+        """Quantize opacities to the pen tier index used when drawing"""
+        return (opacity * self.OPACITY_TIERS).astype(np.int32).clip(0, self.OPACITY_TIERS - 1)
     
     def update_particles(self):
-        import random
-        for p in self.particles:
-            p["x"] += p["vx"]
-            p["y"] += p["vy"]
+        prev_min, prev_max = self.pos.min(axis=0), self.pos.max(axis=0)
+        if self.use_numba:
+            step_particles(self.particles, float(self.width()), float(self.height()))
+        else:
+            self.pos += self.vel
             
-            if p["x"] < 0 or p["x"] > self.width():
-                p["vx"] *= -1
-            if p["y"] < 0 or p["y"] > self.height():
-                p["vy"] *= -1
-                
-            if random.randint(0, 200) == 0:
-                p["opacity"] = random.uniform(0.1, 0.8)
+            # Bounce off the widget edges by flipping the float32 sign bit
+            mask_x = (self.pos[:, 0] < 0) | (self.pos[:, 0] > self.width())
+            mask_y = (self.pos[:, 1] < 0) | (self.pos[:, 1] > self.height())
+            self.vel_bits[mask_x, 0] ^= SIGN_BIT
+            self.vel_bits[mask_y, 1] ^= SIGN_BIT
+        
+        # Occasionally re-roll a particle's opacity: draw how many (~0.5 per frame)
+        # with one binomial sample instead of a Bernoulli trial per particle
+        k = int(np.random.binomial(self.count, 1 / 201))
+        if k:
+            idx = np.random.randint(0, self.count, k)
+            self.opacity[idx] = np.random.uniform(0.1, 0.8, k)
+            self.tiers[idx] = self.opacity_tiers(self.opacity[idx])
+            self.group_tiers()
+        
+        # Nothing on screen to refresh (obscured or minimized)
+        if self.visibleRegion().isEmpty():
+            return
         
-        self.update()
+        # Only invalidate the box covering old and new particle positions
+        x_min, y_min = np.minimum(prev_min, self.pos.min(axis=0)) - 2
+        x_max, y_max = np.maximum(prev_max, self.pos.max(axis=0)) + 2
+        self.update(QRect(int(x_min), int(y_min), int(x_max - x_min) + 4, int(y_max - y_min) + 4))
     
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Background gradient
+    def resizeEvent(self, event):
+        self.bg_pixmap = None
+        super().resizeEvent(event)
+    
+    def render_background(self):
+        """Render the static background gradient into a pixmap the size of the widget"""
+        pixmap = QPixmap(self.size())
+        painter = QPainter(pixmap)
         gradient = QLinearGradient(0, 0, 0, self.height())
         gradient.setColorAt(0, QColor("#0a0f19"))
         gradient.setColorAt(1, QColor("#1a1f2e"))
-        painter.fillRect(self.rect(), gradient)
-        
-        # Draw particles
-        painter.setPen(Qt.PenStyle.NoPen)
-        for p in self.particles:
-            alpha = int(p["opacity"] * 255)
-            painter.setBrush(QColor(0, 247, 255, alpha))
-            painter.drawEllipse(int(p["x"]), int(p["y"]), 2, 2)
+        painter.fillRect(pixmap.rect(), gradient)
+        painter.end()
+        return pixmap
+    
+    def paintEvent(self, event):
+        # No antialiasing: 2px dots and a full-rect fill gain nothing from it
+        painter = QPainter(self)
+        
+        # Background gradient, rendered once per size
+        if self.bg_pixmap is None or self.bg_pixmap.size() != self.size():
+            self.bg_pixmap = self.render_background()
+        painter.drawPixmap(0, 0, self.bg_pixmap)
+        
+        # Draw particles, batched by opacity tier
+        points = self.pos[self.tier_order].astype(np.int32)
+        for tier, pen in enumerate(self.tier_pens):
+            start, end = self.tier_bounds[tier], self.tier_bounds[tier + 1]
+            if end > start:
+                painter.setPen(pen)
+                painter.drawPoints(QPolygon(points[start:end].ravel().tolist()))
 
 class GlowingButton(QPushButton):
     def __init__(self, text, color="#00f7ff", parent=None):
         super().__init__(text, parent)
-        self.glow_effect = QGraphicsDropShadowEffect()
-        self.glow_effect.setBlurRadius(20)
-        self.glow_effect.setColor(QColor(color))
-        self.glow_effect.setOffset(0, 0)
-        self.setGraphicsEffect(self.glow_effect)
+        # A border in the glow colour instead of QGraphicsDropShadowEffect, which
+        # re-blurs the button through an offscreen buffer on every repaint
+        self.setStyleSheet(f"QPushButton {{ border: 2px solid {color}; }}")
 
 class APISetupWindow(QWidget):
     api_configured = pyqtSignal(str)  # Signal to emit when API is configured
     
+    VALIDATION_CACHE_TTL = 300  # seconds
+    SIMULATED_DELAY_MS = 2000
+    
+    _STYLESHEET = """
+        QFrame#mainFrame {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                stop:0 rgba(15, 20, 35, 220), 
+                stop:1 rgba(25, 30, 45, 220));
+            border: 2px solid rgba(0, 247, 255, 100);
+            border-radius: 20px;
+        }
+        
+        QFrame#section {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                stop:0 rgba(5, 15, 25, 150), 
+                stop:1 rgba(15, 25, 35, 150));
+            border: 1px solid rgba(0, 247, 255, 120);
+            border-radius: 15px;
+            padding: 20px;
+        }
+        
+        QFrame#inputContainer {
+            background: rgba(0, 0, 0, 80);
+            border: 1px solid rgba(0, 247, 255, 60);
+            border-radius: 12px;
+            padding: 5px;
+        }
+        
+        QLabel#title {
+            font-family: 'Segoe UI', 'Arial', sans-serif;
+            font-size: 28px;
+            font-weight: bold;
+            color: #ffffff;
+            text-shadow: 0 0 25px #00f7ff;
+            letter-spacing: 2px;
+            padding: 8px;
+        }
+        
+        QLabel#subtitle {
+            font-family: 'Segoe UI', 'Arial', sans-serif;
+            font-size: 14px;
+            color: rgba(0, 247, 255, 200);
+            font-style: italic;
+            padding: 5px;
+        }
+        
+        QLabel#apiIcon {
+            font-size: 24px;
+            padding: 5px;
+        }
+        
+        QLabel#fieldLabel {
+            font-family: 'Segoe UI', 'Arial', sans-serif;
+            font-size: 16px;
+            font-weight: bold;
+            color: #ffffff;
+            padding: 5px;
+        }
+        
+        QLabel#helpText {
+            font-family: 'Segoe UI', 'Arial', sans-serif;
+            font-size: 11px;
+            color: rgba(0, 247, 255, 150);
+            font-style: italic;
+            padding: 5px;
+        }
+        
+        QLabel#statusLabel {
+            font-family: 'Segoe UI', 'Arial', sans-serif;
+            font-size: 13px;
+            font-weight: bold;
+            padding: 15px;
+            border-radius: 8px;
+            margin: 10px;
+        }
+        
+        QLabel#statusLabel[state="success"] {
+            color: #00ff88;
+            text-shadow: 0 0 8px #00ff88;
+            background: rgba(0, 255, 136, 20);
+            border: 1px solid rgba(0, 255, 136, 50);
+        }
+        
+        QLabel#statusLabel[state="error"] {
+            color: #ff2222;
+            text-shadow: 0 0 8px #ff2222;
+            background: rgba(255, 34, 34, 20);
+            border: 1px solid rgba(255, 34, 34, 50);
+        }
+        
+        QLabel#statusLabel[state="pending"] {
+            color: #ffff00;
+            text-shadow: 0 0 8px #ffff00;
+        }
+        
+        QLabel#footer {
+            font-family: 'Courier New', monospace;
+            font-size: 9px;
+            color: rgba(0, 247, 255, 80);
+        }
+        
+        QLineEdit#apiInput {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                stop:0 rgba(0, 10, 20, 180), 
+                stop:1 rgba(0, 20, 30, 180));
+            border: 2px solid rgba(0, 247, 255, 100);
+            border-radius: 8px;
+            padding: 12px 15px;
+            color: #ffffff;
+            font-size: 14px;
+            font-family: 'Segoe UI', 'Arial', sans-serif;
+            font-weight: 500;
+            min-height: 20px;
+        }
+        
+        QLineEdit#apiInput:focus {
+            border: 2px solid #00f7ff;
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                stop:0 rgba(0, 20, 35, 200), 
+                stop:1 rgba(0, 35, 50, 200));
+            box-shadow: 0 0 15px rgba(0, 247, 255, 50);
+        }
+        
+        QLineEdit#apiInput::placeholder {
+            color: rgba(0, 247, 255, 120);
+            font-style: italic;
+        }
+        
+        QCheckBox#checkbox {
+            color: rgba(0, 247, 255, 180);
+            font-family: 'Segoe UI', 'Arial', sans-serif;
+            font-size: 12px;
+            font-weight: 500;
+            padding: 5px;
+        }
+        
+        QCheckBox#checkbox::indicator {
+            width: 18px;
+            height: 18px;
+            border: 2px solid rgba(0, 247, 255, 100);
+            border-radius: 4px;
+            background: rgba(0, 0, 0, 120);
+        }
+        
+        QCheckBox#checkbox::indicator:checked {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
+                stop:0 #00f7ff, stop:1 #008c9e);
+            border: 2px solid #00f7ff;
+        }
+        
+        QCheckBox#checkbox::indicator:hover {
+            border: 2px solid #00f7ff;
+            background: rgba(0, 247, 255, 20);
+        }
+        
+        QPushButton {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                stop:0 #00f7ff, stop:1 #008c9e);
+            color: #05080f;
+            border: none;
+            border-radius: 10px;
+            font-weight: bold;
+            font-size: 13px;
+            font-family: 'Segoe UI', 'Arial', sans-serif;
+            padding: 12px 25px;
+            letter-spacing: 1px;
+            min-height: 20px;
+        }
+        
+        QPushButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                stop:0 #ffffff, stop:1 #00f7ff);
+            color: #000000;
+            transform: translateY(-2px);
+        }
+        
+        QPushButton:pressed {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                stop:0 #008c9e, stop:1 #00f7ff);
+            transform: translateY(1px);
+        }
+        
+        QPushButton:disabled {
+            background: rgba(100, 100, 100, 100);
+            color: rgba(255, 255, 255, 100);
+        }
+    """
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("TIYA - API Configuration")
@@ -135,8 +526,22 @@ class APISetupWindow(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         
         self.config_file = "tiya_config.json"
+        self._last_move_ns = 0
+        self._pending_status = None
+        self._validating = False
+        self._validation_cache = {}  # key hash -> (monotonic timestamp, message)
+        self.validation_signals = APIValidationSignals()
+        self.validation_signals.validation_complete.connect(self.handle_validation_result)
+        self.validation_signals.simulation_complete.connect(self.handle_simulated_result)
+        self._config = {}
         self.init_ui()
-        self.load_existing_config()
+        
+        # Read the saved config off the GUI thread once the event loop is running
+        self.config_signals = ConfigLoaderSignals()
+        self.config_signals.config_loaded.connect(self.handle_config_loaded)
+        self.config_signals.config_saved.connect(self.handle_config_saved)
+        self.config_signals.config_save_failed.connect(self.handle_config_save_failed)
+        QTimer.singleShot(0, self.load_config_async)
     
     def init_ui(self):
         # Base layout with stacked widgets for layering
@@ -262,174 +667,7 @@ class APISetupWindow(QWidget):
         main_layout.addStretch()
         main_layout.addWidget(footer)
         
-        self.setStyleSheet(self.get_stylesheet())
-    
-    def get_stylesheet(self):
-        return """
-            QFrame#mainFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 rgba(15, 20, 35, 220), 
-                    stop:1 rgba(25, 30, 45, 220));
-                border: 2px solid rgba(0, 247, 255, 100);
-                border-radius: 20px;
-            }
-            
-            QFrame#section {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 rgba(5, 15, 25, 150), 
-                    stop:1 rgba(15, 25, 35, 150));
-                border: 1px solid rgba(0, 247, 255, 120);
-                border-radius: 15px;
-                padding: 20px;
-            }
-            
-            QFrame#inputContainer {
-                background: rgba(0, 0, 0, 80);
-                border: 1px solid rgba(0, 247, 255, 60);
-                border-radius: 12px;
-                padding: 5px;
-            }
-            
-            QLabel#title {
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 28px;
-                font-weight: bold;
-                color: #ffffff;
-                text-shadow: 0 0 25px #00f7ff;
-                letter-spacing: 2px;
-                padding: 8px;
-            }
-            
-            QLabel#subtitle {
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 14px;
-                color: rgba(0, 247, 255, 200);
-                font-style: italic;
-                padding: 5px;
-            }
-            
-            QLabel#apiIcon {
-                font-size: 24px;
-                padding: 5px;
-            }
-            
-            QLabel#fieldLabel {
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 16px;
-                font-weight: bold;
-                color: #ffffff;
-                padding: 5px;
-            }
-            
-            QLabel#helpText {
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 11px;
-                color: rgba(0, 247, 255, 150);
-                font-style: italic;
-                padding: 5px;
-            }
-            
-            QLabel#statusLabel {
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 13px;
-                font-weight: bold;
-                padding: 15px;
-                border-radius: 8px;
-                margin: 10px;
-            }
-            
-            QLabel#footer {
-                font-family: 'Courier New', monospace;
-                font-size: 9px;
-                color: rgba(0, 247, 255, 80);
-            }
-            
-            QLineEdit#apiInput {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 rgba(0, 10, 20, 180), 
-                    stop:1 rgba(0, 20, 30, 180));
-                border: 2px solid rgba(0, 247, 255, 100);
-                border-radius: 8px;
-                padding: 12px 15px;
-                color: #ffffff;
-                font-size: 14px;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-weight: 500;
-                min-height: 20px;
-            }
-            
-            QLineEdit#apiInput:focus {
-                border: 2px solid #00f7ff;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 rgba(0, 20, 35, 200), 
-                    stop:1 rgba(0, 35, 50, 200));
-                box-shadow: 0 0 15px rgba(0, 247, 255, 50);
-            }
-            
-            QLineEdit#apiInput::placeholder {
-                color: rgba(0, 247, 255, 120);
-                font-style: italic;
-            }
-            
-            QCheckBox#checkbox {
-                color: rgba(0, 247, 255, 180);
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                font-size: 12px;
-                font-weight: 500;
-                padding: 5px;
-            }
-            
-            QCheckBox#checkbox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid rgba(0, 247, 255, 100);
-                border-radius: 4px;
-                background: rgba(0, 0, 0, 120);
-            }
-            
-            QCheckBox#checkbox::indicator:checked {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #00f7ff, stop:1 #008c9e);
-                border: 2px solid #00f7ff;
-            }
-            
-            QCheckBox#checkbox::indicator:hover {
-                border: 2px solid #00f7ff;
-                background: rgba(0, 247, 255, 20);
-            }
-            
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                    stop:0 #00f7ff, stop:1 #008c9e);
-                color: #05080f;
-                border: none;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 13px;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                padding: 12px 25px;
-                letter-spacing: 1px;
-                min-height: 20px;
-            }
-            
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                    stop:0 #ffffff, stop:1 #00f7ff);
-                color: #000000;
-                transform: translateY(-2px);
-            }
-            
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                    stop:0 #008c9e, stop:1 #00f7ff);
-                transform: translateY(1px);
-            }
-            
-            QPushButton:disabled {
-                background: rgba(100, 100, 100, 100);
-                color: rgba(255, 255, 255, 100);
-            }
-        """
+        self.setStyleSheet(APISetupWindow._STYLESHEET)
     
     def toggle_api_visibility(self, checked):
         if checked:
@@ -438,87 +676,133 @@ class APISetupWindow(QWidget):
             self.api_input.setEchoMode(QLineEdit.EchoMode.Password)
     
     def validate_and_save_api(self):
+        # Ignore repeat clicks while a validation is in flight or just finished
+        if self._validating:
+            return
+        
         api_key = self.api_input.text().strip()
         
         if not api_key:
             self.show_status("ERROR: API key cannot be empty", "error")
             return
         
-        self.status_label.setText("⏳ Validating API key...")
-        self.status_label.setStyleSheet("color: #ffff00; text-shadow: 0 0 8px #ffff00;")
+        # Skip the network round-trip for a key that already passed validation
+        key_hash = hash_api_key(api_key)
+        cached = self._validation_cache.get(key_hash)
+        cached_message = None
+        if cached and time.monotonic() - cached[0] < self.VALIDATION_CACHE_TTL:
+            cached_message = cached[1]
+        elif key_hash == self._config.get('validated_key_hash'):
+            cached_message = "API key previously validated"
+        # Configs saved before key hashes were recorded still hold the validated key itself
+        elif self._config.get('configured') and api_key == self._config.get('gemini_api_key'):
+            cached_message = "Using cached validation"
+        if cached_message:
+            # Lock out repeat clicks until the save lands, as for a network validation
+            self._validating = True
+            self.validate_btn.setEnabled(False)
+            self.handle_validation_result(api_key, True, cached_message)
+            return
+        
+        self.show_status("⏳ Validating API key...", "pending")
         
-        # Disable button during validation
+        # Disable button and freeze the key during validation
         self.validate_btn.setEnabled(False)
         self.validate_btn.setText("🔄 Validating...")
+        self.api_input.setReadOnly(True)
         
-        # Start validation thread
-        self.validation_thread = APIValidationThread(api_key)
-        self.validation_thread.validation_complete.connect(self.handle_validation_result)
-        self.validation_thread.start()
+        # Run validation on a pooled thread
+        self._validating = True
+        QThreadPool.globalInstance().start(APIValidationTask(api_key, self.validation_signals))
     
-    def handle_validation_result(self, is_valid, message):
+    def handle_simulated_result(self, api_key, is_valid, message):
+        """Deliver a simulated validation result after the usual delay"""
+        QTimer.singleShot(self.SIMULATED_DELAY_MS, lambda: self.handle_validation_result(api_key, is_valid, message))
+    
+    def handle_validation_result(self, api_key, is_valid, message):
         """Handle the result of API validation"""
-        self.validate_btn.setEnabled(True)
         self.validate_btn.setText("🔒 Validate & Save API Key")
         
         if is_valid:
-            api_key = self.api_input.text().strip()
+            key_hash = hash_api_key(api_key)
+            self._validation_cache[key_hash] = (time.monotonic(), message)
             config = {
                 "gemini_api_key": api_key,
                 "configured": True,
-                "setup_date": str(QTimer().currentTime()),
-                "validation_message": message
+                "setup_date": datetime.now().isoformat(),
+                "validation_message": message,
+                "validated_key_hash": key_hash
             }
-            
-            try:
-                with open(self.config_file, 'w') as f:
-                    json.dump(config, f, indent=2)
-                
-                self.show_status(f"✓ {message.upper()}", "success")
-                self.validate_btn.setVisible(False)
-                self.continue_btn.setVisible(True)
-                
-            except Exception as e:
-                self.show_status(f"ERROR: Failed to save config - {str(e)}", "error")
+            # The lockout ends once the config is written, so a second click can't start another writer
+            QThreadPool.globalInstance().start(ConfigWriter(self.config_file, config, self.config_signals))
         else:
+            QTimer.singleShot(300, self.end_validation_lockout)
             self.show_status(f"ERROR: {message}", "error")
     
+    def handle_config_saved(self, config):
+        self.end_validation_lockout()
+        self._config = config
+        self.show_status(f"✓ {config['validation_message'].upper()}", "success")
+        self.validate_btn.setVisible(False)
+        self.continue_btn.setVisible(True)
+    
+    def handle_config_save_failed(self, error):
+        self.end_validation_lockout()
+        self.show_status(f"ERROR: Failed to save config - {error}", "error")
+    
+    def end_validation_lockout(self):
+        self._validating = False
+        self.validate_btn.setEnabled(True)
+        self.api_input.setReadOnly(False)
+    
     def show_status(self, message, status_type):
+        # Several status changes in one event-loop pass collapse into a single restyle
+        if self._pending_status is None:
+            QTimer.singleShot(0, self.apply_status)
+        self._pending_status = (message, status_type)
+    
+    def apply_status(self):
+        message, status_type = self._pending_status
+        self._pending_status = None
         self.status_label.setText(message)
-        if status_type == "success":
-            self.status_label.setStyleSheet("color: #00ff88; text-shadow: 0 0 8px #00ff88; background: rgba(0, 255, 136, 20); border: 1px solid rgba(0, 255, 136, 50);")
-        elif status_type == "error":
-            self.status_label.setStyleSheet("color: #ff2222; text-shadow: 0 0 8px #ff2222; background: rgba(255, 34, 34, 20); border: 1px solid rgba(255, 34, 34, 50);")
-        else:
-            self.status_label.setStyleSheet("color: #ffff00; text-shadow: 0 0 8px #ffff00;")
+        # Switch the [state=...] selector in the window stylesheet; re-polishing
+        # restyles the label without parsing any new QSS
+        if status_type not in ("success", "error"):
+            status_type = "pending"
+        self.status_label.setProperty("state", status_type)
+        self.status_label.style().unpolish(self.status_label)
+        self.status_label.style().polish(self.status_label)
     
     def continue_to_main(self):
         api_key = self.load_api_key()
         self.api_configured.emit(api_key or "")
         self.close()
     
+    def load_config_async(self):
+        QThreadPool.globalInstance().start(ConfigLoader(self.config_file, self.config_signals))
+    
+    def handle_config_loaded(self, config):
+        # A key saved before the read finished is newer than what is on disk
+        if self._config:
+            return
+        self._config = config
+        self.load_existing_config()
+    
     def load_existing_config(self):
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    if config.get('configured') and config.get('gemini_api_key'):
-                        self.api_input.setText(config['gemini_api_key'])
-                        self.show_status("✓ EXISTING CONFIGURATION FOUND", "success")
-                        self.validate_btn.setText("🔄 Update & Save API Key")
-                        self.continue_btn.setVisible(True)
-        except Exception as e:
-            print(f"Error loading config: {e}")
+        config = self._config
+        if config.get('configured') and config.get('gemini_api_key'):
+            self.api_input.setText(config['gemini_api_key'])
+            self.show_status("✓ EXISTING CONFIGURATION FOUND", "success")
+            self.validate_btn.setText("🔄 Update & Save API Key")
+            self.continue_btn.setVisible(True)
     
     def load_api_key(self):
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    return config.get('gemini_api_key', '')
-        except:
-            pass
-        return ''
+        return self._config.get('gemini_api_key', '')
+    
+    def closeEvent(self, event):
+        # Make sure the background stops ticking once the window is dismissed
+        self.background.timer.stop()
+        super().closeEvent(event)
     
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -526,9 +810,24 @@ class APISetupWindow(QWidget):
     
     def mouseMoveEvent(self, event):
         if hasattr(self, 'oldPos') and event.buttons() == Qt.MouseButton.LeftButton:
-            delta = event.globalPosition().toPoint() - self.oldPos
+            # Move at most ~60 times a second; skipped events accumulate into the next delta
+            now = time.monotonic_ns()
+            if now - self._last_move_ns < 16_000_000:
+                return
+            self._last_move_ns = now
+            self.drag_to(event.globalPosition().toPoint())
+    
+    def mouseReleaseEvent(self, event):
+        # Apply whatever the throttle skipped, so the window ends where the cursor was released
+        if hasattr(self, 'oldPos') and event.button() == Qt.MouseButton.LeftButton:
+            self.drag_to(event.globalPosition().toPoint())
+    
+    def drag_to(self, global_pos):
+        """Move the window by the cursor travel since oldPos"""
+        delta = global_pos - self.oldPos
+        if not delta.isNull():
             self.move(self.x() + delta.x(), self.y() + delta.y())
-            self.oldPos = event.globalPosition().toPoint()
+        self.oldPos = global_pos
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -4,12 +4,40 @@ import json
 import os
 from datetime import datetime
 import hashlib
+import functools
+import threading
+import time
+
+@functools.lru_cache(maxsize=256)
+def _hash_username(username):
+    return hashlib.sha256(username.lower().encode()).hexdigest()
 
 class FirebaseManager:
+    CACHE_TTL = 60  # seconds that cached reads are trusted
+    CHAT_FLUSH_DELAY = 10  # seconds queued chat saves wait before being flushed
+    
     def __init__(self):
         self.db = None
         self.initialized = False
-        self.init_firebase()
+        # Connection is deferred until the first call so importing this module stays cheap
+        self._init_attempted = False
+        self._init_lock = threading.Lock()
+        self._user_refs = {}
+        # user hash -> (monotonic timestamp, value); kept current by the store_* methods
+        self._api_key_cache = {}
+        self._prefs_cache = {}
+        # Chat saves are queued here and sent in the background; see flush_chat_history
+        self._chat_writer = None
+        self._chat_writer_lock = threading.Lock()
+        self._chat_flush_timer = None
+    
+    def ensure_initialized(self):
+        """Initialize Firebase on first use; returns whether it is available"""
+        with self._init_lock:
+            if not self._init_attempted:
+                self._init_attempted = True
+                self.init_firebase()
+        return self.initialized
     
     def init_firebase(self):
         """Initialize Firebase connection"""
@@ -58,25 +86,33 @@ class FirebaseManager:
         print("Created firebase_credentials.json template. Please fill it with your actual Firebase credentials.")
     
     def hash_username(self, username):
-        """Create a secure hash of username for storage"""
-        return hashlib.sha256(username.lower().encode()).hexdigest()
+        """Create a secure hash of username for storage (memoized per username)"""
+        return _hash_username(username)
+    
+    def _user_ref(self, user_hash):
+        """Return the cached DocumentReference for a user's document"""
+        ref = self._user_refs.get(user_hash)
+        if ref is None:
+            ref = self._user_refs[user_hash] = self.db.collection('users').document(user_hash)
+        return ref
     
     def store_user_api_key(self, username, api_key):
         """Store user's API key in Firebase"""
-        if not self.initialized:
+        if not self.ensure_initialized():
             return False, "Firebase not initialized"
         
         try:
             user_hash = self.hash_username(username)
             user_data = {
                 'api_key': api_key,
-                'last_updated': datetime.now(),
+                'last_updated': firestore.SERVER_TIMESTAMP,
                 'username_hash': user_hash,
-                'created_at': datetime.now()
+                'created_at': firestore.SERVER_TIMESTAMP
             }
             
             # Store in 'users' collection with hashed username as document ID
-            self.db.collection('users').document(user_hash).set(user_data, merge=True)
+            self._user_ref(user_hash).set(user_data, merge=True)
+            self._api_key_cache[user_hash] = (time.monotonic(), api_key)
             return True, "API key stored successfully"
             
         except Exception as e:
@@ -84,17 +120,23 @@ class FirebaseManager:
     
     def get_user_api_key(self, username):
         """Retrieve user's API key from Firebase"""
-        if not self.initialized:
+        if not self.ensure_initialized():
             return None, "Firebase not initialized"
         
         try:
             user_hash = self.hash_username(username)
-            doc_ref = self.db.collection('users').document(user_hash)
-            doc = doc_ref.get()
+            cached_at, api_key = self._api_key_cache.get(user_hash, (0, None))
+            if api_key and time.monotonic() - cached_at < self.CACHE_TTL:
+                return api_key, "API key retrieved successfully"
+            
+            doc_ref = self._user_ref(user_hash)
+            doc = doc_ref.get(field_paths=['api_key'])
             
             if doc.exists:
                 data = doc.to_dict()
-                return data.get('api_key'), "API key retrieved successfully"
+                api_key = data.get('api_key')
+                self._api_key_cache[user_hash] = (time.monotonic(), api_key)
+                return api_key, "API key retrieved successfully"
             else:
                 return None, "User not found"
                 
@@ -103,13 +145,13 @@ class FirebaseManager:
     
     def update_user_last_login(self, username):
         """Update user's last login timestamp"""
-        if not self.initialized:
+        if not self.ensure_initialized():
             return False
         
         try:
             user_hash = self.hash_username(username)
-            self.db.collection('users').document(user_hash).update({
-                'last_login': datetime.now()
+            self._user_ref(user_hash).update({
+                'last_login': firestore.SERVER_TIMESTAMP
             })
             return True
         except Exception as e:
@@ -118,15 +160,16 @@ class FirebaseManager:
     
     def store_user_preferences(self, username, preferences):
         """Store user preferences"""
-        if not self.initialized:
+        if not self.ensure_initialized():
             return False
         
         try:
             user_hash = self.hash_username(username)
-            self.db.collection('users').document(user_hash).update({
+            self._user_ref(user_hash).update({
                 'preferences': preferences,
-                'preferences_updated': datetime.now()
+                'preferences_updated': firestore.SERVER_TIMESTAMP
             })
+            self._prefs_cache[user_hash] = (time.monotonic(), preferences)
             return True
         except Exception as e:
             print(f"Error storing preferences: {e}")
@@ -134,17 +177,23 @@ class FirebaseManager:
     
     def get_user_preferences(self, username):
         """Retrieve user preferences"""
-        if not self.initialized:
+        if not self.ensure_initialized():
             return {}
         
         try:
             user_hash = self.hash_username(username)
-            doc_ref = self.db.collection('users').document(user_hash)
-            doc = doc_ref.get()
+            cached_at, preferences = self._prefs_cache.get(user_hash, (0, None))
+            if preferences is not None and time.monotonic() - cached_at < self.CACHE_TTL:
+                return preferences
+            
+            doc_ref = self._user_ref(user_hash)
+            doc = doc_ref.get(field_paths=['preferences'])
             
             if doc.exists:
                 data = doc.to_dict()
-                return data.get('preferences', {})
+                preferences = data.get('preferences', {})
+                self._prefs_cache[user_hash] = (time.monotonic(), preferences)
+                return preferences
             else:
                 return {}
                 
@@ -154,30 +203,73 @@ class FirebaseManager:
     
     def store_chat_history(self, username, chat_data):
         """Store chat history for a user"""
-        if not self.initialized:
+        if not self.ensure_initialized():
             return False
         
         try:
             user_hash = self.hash_username(username)
             chat_id = datetime.now().strftime("%Y%m%d_%H%M%S")
             
-            self.db.collection('users').document(user_hash).collection('chats').document(chat_id).set({
+            self._get_chat_writer().set(self._user_ref(user_hash).collection('chats').document(chat_id), {
                 'messages': chat_data,
-                'timestamp': datetime.now()
+                'timestamp': firestore.SERVER_TIMESTAMP
             })
+            self._schedule_chat_flush()
             return True
         except Exception as e:
             print(f"Error storing chat history: {e}")
             return False
     
+    def _get_chat_writer(self):
+        """Return the shared chat BulkWriter, creating it on first use"""
+        with self._chat_writer_lock:
+            if self._chat_writer is None:
+                self._chat_writer = self.db.bulk_writer()
+            return self._chat_writer
+    
+    def _schedule_chat_flush(self):
+        """Flush queued chat saves once, shortly after the first of them, on a timer thread"""
+        with self._chat_writer_lock:
+            if self._chat_flush_timer is not None:
+                return
+            self._chat_flush_timer = threading.Timer(self.CHAT_FLUSH_DELAY, self.flush_chat_history)
+            self._chat_flush_timer.daemon = True
+            self._chat_flush_timer.start()
+    
+    def flush_chat_history(self):
+        """Send any chat writes still queued in the bulk writer (blocks until they finish)"""
+        with self._chat_writer_lock:
+            self._chat_flush_timer = None
+            writer = self._chat_writer
+        if writer is None:
+            return
+        try:
+            writer.flush()
+        except Exception as e:
+            print(f"Error flushing chat history: {e}")
+    
+    def close_chat_history(self):
+        """Send queued chat writes and shut the bulk writer down"""
+        with self._chat_writer_lock:
+            if self._chat_flush_timer is not None:
+                self._chat_flush_timer.cancel()
+                self._chat_flush_timer = None
+            writer, self._chat_writer = self._chat_writer, None
+        if writer is None:
+            return
+        try:
+            writer.close()
+        except Exception as e:
+            print(f"Error closing chat history writer: {e}")
+    
     def get_chat_history(self, username, limit=10):
         """Retrieve recent chat history for a user"""
-        if not self.initialized:
+        if not self.ensure_initialized():
             return []
         
         try:
             user_hash = self.hash_username(username)
-            chats_ref = self.db.collection('users').document(user_hash).collection('chats')
+            chats_ref = self._user_ref(user_hash).collection('chats')
             docs = chats_ref.order_by('timestamp', direction=firestore.Query.DESCENDING).limit(limit).stream()
             
             chat_history = []
@@ -196,20 +288,24 @@ class FirebaseManager:
     
     def delete_user_data(self, username):
         """Delete all user data (for privacy compliance)"""
-        if not self.initialized:
+        if not self.ensure_initialized():
             return False
         
         try:
             user_hash = self.hash_username(username)
             
-            # Delete chat history
-            chats_ref = self.db.collection('users').document(user_hash).collection('chats')
-            docs = chats_ref.stream()
-            for doc in docs:
-                doc.reference.delete()
+            # Delete chat history in pipelined batches; list_documents yields
+            # references only, so no chat bodies are downloaded
+            chats_ref = self._user_ref(user_hash).collection('chats')
+            bulk_writer = self.db.bulk_writer()
+            for doc_ref in chats_ref.list_documents():
+                bulk_writer.delete(doc_ref)
+            bulk_writer.close()
             
             # Delete user document
-            self.db.collection('users').document(user_hash).delete()
+            self._user_ref(user_hash).delete()
+            self._api_key_cache.pop(user_hash, None)
+            self._prefs_cache.pop(user_hash, None)
             return True
         except Exception as e:
             print(f"Error deleting user data: {e}")
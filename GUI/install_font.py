@@ -1,6 +1,9 @@
 import os
 import requests
 import shutil
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 
 # Direct links to Orbitron TTF files from Google Fonts GitHub repo
 FONT_URLS = [
@@ -11,28 +14,63 @@ FONT_URLS = [
     "https://github.com/google/fonts/raw/main/ofl/orbitron/Orbitron-SemiBold.ttf"
 ]
 
+def create_session():
+    """Create a pooled HTTP session shared by all font downloads"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    return session
+
+def download_font(session, url, font_dir):
+    """Download a single font file into font_dir"""
+    font_name = url.split('/')[-1]
+    dest_path = os.path.join(font_dir, font_name)
+
+    if os.path.exists(dest_path) and os.path.getsize(dest_path) > 0:
+        print(f"Already installed: {font_name}")
+        return
+
+    print(f"Downloading {font_name}...")
+
+    # Write beside the target and swap it in, so an interrupted download never
+    # leaves a truncated font in the Fonts folder
+    tmp_path = dest_path + ".part"
+    try:
+        response = session.get(url, stream=True, timeout=(5, 30))
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with open(tmp_path, 'wb') as f:
+            shutil.copyfileobj(response.raw, f, length=262144)
+        os.replace(tmp_path, dest_path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    print(f"Installed: {font_name}")
+
 def install_fonts():
+    session = create_session()
     try:
         font_dir = os.path.join(os.environ['WINDIR'], 'Fonts')
-        for url in FONT_URLS:
-            font_name = url.split('/')[-1]
-            print(f"Downloading {font_name}...")
-            
-            response = requests.get(url, stream=True)
-            dest_path = os.path.join(font_dir, font_name)
-            
-            with open(dest_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            print(f"Installed: {font_name}")
-        
+        # Downloads are network-bound, so fetch them all at once
+        with ThreadPoolExecutor(max_workers=len(FONT_URLS)) as executor:
+            futures = [executor.submit(download_font, session, url, font_dir) for url in FONT_URLS]
+            for future in futures:
+                future.result()
+
         print("All fonts installed successfully!")
         return True
-    
+
     except Exception as e:
         print(f"Error: {str(e)}")
         return False
 
+    finally:
+        session.close()
+
 if __name__ == "__main__":
-    install_fonts()
\ No newline at end of file
+    install_fonts()
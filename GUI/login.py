@@ -1,12 +1,24 @@
 import sys
-import math
-import random
+import hashlib
+import hmac
+import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
-    QHBoxLayout, QMessageBox, QGraphicsDropShadowEffect, QFrame, QStackedLayout
+    QHBoxLayout, QMessageBox, QFrame, QStackedLayout, QGraphicsOpacityEffect
 )
 from PyQt5.QtGui import QFont, QPixmap, QPalette, QColor, QPainter, QBrush, QLinearGradient, QPen, QFontDatabase
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty, QRect, QPointF, QSequentialAnimationGroup, QParallelAnimationGroup
+from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty, pyqtSignal, QRect, QPointF, QLineF, QElapsedTimer, QSequentialAnimationGroup, QParallelAnimationGroup
+
+# Valid users (you can expand this or move to Firebase); only password digests are kept
+VALID_USERS = {
+    user: hashlib.sha256(pwd.encode()).digest()
+    for user, pwd in {"daksh lohchab": "886", "operator": "quantum", "admin": "singularity", "tiya": "protocol"}.items()
+}
+
+def check_credentials(user, pwd):
+    """Check a login against VALID_USERS with a constant-time digest compare"""
+    digest = VALID_USERS.get(user)
+    return digest is not None and hmac.compare_digest(digest, hashlib.sha256(pwd.encode()).digest())
 
 # Custom Animated Background Widget
 class AnimatedBackground(QWidget):
@@ -16,70 +28,121 @@ class AnimatedBackground(QWidget):
     """
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.stars = []
         self.init_stars(200)
-
+        
+        # Paint-time objects are built once; only the size-dependent ones change on resize
+        self.grid_pen = QPen(QColor(0, 247, 255, 15))
+        self.white_alpha = [QColor(255, 255, 255, a) for a in range(256)]
+        self.bg_gradient = QLinearGradient()
+        self.bg_gradient.setColorAt(0, QColor("#05080f"))
+        self.bg_gradient.setColorAt(1, QColor("#101422"))
+        self.grid_lines = []
+        self.bg_pixmap = None
+
+        # Motion advances by measured time, in units of the nominal 50 ms tick
+        self.elapsed = QElapsedTimer()
+        self.elapsed.start()
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_stars)
-        self.timer.start(50)
+        self.timer.setInterval(50)
+
+    def showEvent(self, event):
+        # Animate only while shown
+        self.elapsed.restart()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
 
     def init_stars(self, number_of_stars):
+        # Star state lives in parallel arrays so each tick is a few vectorized ops
         screen_size = QApplication.primaryScreen().size()
-        for _ in range(number_of_stars):
-            self.stars.append({
-                "pos": QPointF(random.randint(0, screen_size.width()), random.randint(0, screen_size.height())),
-                "opacity": random.uniform(0.1, 0.7),
-                "fall_speed": random.uniform(0.1, 0.5)
-            })
+        self.star_count = number_of_stars
+        self.star_x = np.random.randint(0, screen_size.width() + 1, number_of_stars).astype(np.float32)
+        self.star_y = np.random.randint(0, screen_size.height() + 1, number_of_stars).astype(np.float32)
+        self.star_opacity = np.random.uniform(0.1, 0.7, number_of_stars).astype(np.float32)
+        self.star_speed = np.random.uniform(0.1, 0.5, number_of_stars).astype(np.float32)
 
     def update_stars(self):
-        for star in self.stars:
-            star["pos"].setY(star["pos"].y() + star["fall_speed"])
-            if star["pos"].y() > self.height():
-                star["pos"].setY(0)
-                star["pos"].setX(random.randint(0, self.width()))
-            
-            if random.randint(0, 100) > 95:
-                star["opacity"] = random.uniform(0.1, 0.7)
-        self.update()
+        step = min(self.elapsed.restart() / 50.0, 4.0)
+        if not self.isVisible():
+            return
+        self.star_y += self.star_speed * step
+        wrapped = self.star_y > self.height()
+        n_wrapped = int(wrapped.sum())
+        if n_wrapped:
+            self.star_y[wrapped] = 0
+            self.star_x[wrapped] = np.random.randint(0, self.width() + 1, n_wrapped)
+        
+        # Roughly 5 in 100 stars pick a new brightness each tick
+        twinkle = np.random.randint(0, 101, self.star_count) > 95
+        self.star_opacity[twinkle] = np.random.uniform(0.1, 0.7, int(twinkle.sum()))
+        
+        # Only invalidate the box the stars occupy (wrapped stars reappear at the top)
+        x_min, x_max = self.star_x.min() - 2, self.star_x.max() + 2
+        y_min = 0 if n_wrapped else self.star_y.min() - self.star_speed.max() * step - 2
+        y_max = self.star_y.max() + 2
+        self.update(QRect(int(x_min), int(y_min), int(x_max - x_min) + 4, int(y_max - y_min) + 4))
+
+    def resizeEvent(self, event):
+        w, h = self.width(), self.height()
+        self.bg_gradient.setFinalStop(0, h)
+        self.grid_lines = [QLineF(i, 0, i, h) for i in range(0, w, 40)]
+        self.grid_lines += [QLineF(0, i, w, i) for i in range(0, h, 40)]
+        self.bg_pixmap = None
+        super().resizeEvent(event)
+
+    def render_background(self):
+        """Render the static gradient and grid into a pixmap the size of the widget"""
+        pixmap = QPixmap(self.size())
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(pixmap.rect(), self.bg_gradient)
+        painter.setPen(self.grid_pen)
+        painter.drawLines(self.grid_lines)
+        painter.end()
+        return pixmap
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor("#05080f"))
-        gradient.setColorAt(1, QColor("#101422"))
-        painter.fillRect(self.rect(), gradient)
-        
-        grid_color = QColor(0, 247, 255, 15)
-        painter.setPen(grid_color)
-        for i in range(0, self.width(), 40):
-            painter.drawLine(i, 0, i, self.height())
-        for i in range(0, self.height(), 40):
-            painter.drawLine(0, i, self.width(), i)
-
-        for star in self.stars:
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(255, 255, 255, int(star["opacity"] * 255)))
-            painter.drawEllipse(star["pos"], 1, 1)
+        # Gradient and grid never change between frames, so blit them from a cache
+        if self.bg_pixmap is None or self.bg_pixmap.size() != self.size():
+            self.bg_pixmap = self.render_background()
+        painter.drawPixmap(0, 0, self.bg_pixmap)
+
+        # Skip stars outside the area being repainted
+        r = event.rect()
+        visible = ((self.star_x >= r.left() - 1) & (self.star_x <= r.right() + 1) &
+                   (self.star_y >= r.top() - 1) & (self.star_y <= r.bottom() + 1))
+        painter.setPen(Qt.PenStyle.NoPen)
+        alphas = (self.star_opacity[visible] * 255).astype(np.int32).tolist()
+        for x, y, a in zip(self.star_x[visible].tolist(), self.star_y[visible].tolist(), alphas):
+            painter.setBrush(self.white_alpha[a])
+            painter.drawEllipse(QPointF(x, y), 1, 1)
 
 # Custom Glowing Button
 class GlowingButton(QPushButton):
+    """
+    The glow is a stylesheet border (see TIYALogin._STYLESHEET) rather than a
+    QGraphicsDropShadowEffect, which re-blurs the button offscreen on every repaint.
+    """
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
-        self.glow_effect = QGraphicsDropShadowEffect()
-        self.glow_effect.setBlurRadius(30)
-        self.glow_effect.setColor(QColor("#00f7ff"))
-        self.glow_effect.setOffset(0, 0)
-        self.setGraphicsEffect(self.glow_effect)
+        self.setObjectName("glowingButton")
 
 # Custom Pulsing Label
 class PulsingLabel(QLabel):
+    """Pulses through an opacity effect so no stylesheet is reparsed per frame"""
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
-        self._opacity = 1.0
-        self.animation = QPropertyAnimation(self, b"opacity")
+        self.setStyleSheet("color: rgba(0, 247, 255, 200); background: transparent;")
+        self.opacity_effect = QGraphicsOpacityEffect(self)
+        self.setGraphicsEffect(self.opacity_effect)
+        self.animation = QPropertyAnimation(self.opacity_effect, b"opacity")
         self.animation.setDuration(2500)
         self.animation.setStartValue(0.4)
         self.animation.setEndValue(1.0)
@@ -87,15 +150,6 @@ class PulsingLabel(QLabel):
         self.animation.setLoopCount(-1)
         self.animation.start()
 
-    @pyqtProperty(float)
-    def opacity(self):
-        return self._opacity
-
-    @opacity.setter
-    def opacity(self, value):
-        self._opacity = value
-        self.setStyleSheet(f"color: rgba(0, 247, 255, {int(value * 200)}); background: transparent;")
-
 # Enhanced Interactive Holographic Sphere Widget
 class HolographicSphere(QWidget):
     def __init__(self, parent=None):
@@ -107,30 +161,43 @@ class HolographicSphere(QWidget):
         self.core_pulse_size, self.core_pulse_direction = 1.0, 1
         self.scan_line_y, self.scan_line_dir = -1.0, 0.01
 
-        self.particles = []
-        for _ in range(20):
-            self.particles.append({
-                "angle": random.uniform(0, 360), "radius_factor": random.uniform(1.1, 1.3),
-                "speed": random.uniform(0.1, 0.4), "size": random.uniform(1, 2.5)
-            })
-
+        # Orbiting particles as parallel arrays so trig runs once per frame for all of them
+        n = 20
+        self.particle_angle = np.random.uniform(0, 360, n)
+        self.particle_radius_factor = np.random.uniform(1.1, 1.3, n)
+        self.particle_speed = np.random.uniform(0.1, 0.4, n)
+        self.particle_size = np.random.uniform(1, 2.5, n).tolist()
+        self.particle_color = QColor(200, 255, 255)
+
+        # Motion advances by measured time, in units of the nominal 16 ms tick
+        self.elapsed = QElapsedTimer()
+        self.elapsed.start()
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_animation)
         self.timer.start(16)
 
     def update_animation(self):
-        self.angle1 = (self.angle1 + 0.5 + self.mouse_influence_y * 0.1) % 360
-        self.angle2 = (self.angle2 + 0.8 + self.mouse_influence_x * 0.1) % 360
-        self.angle3 = (self.angle3 - 0.3) % 360
+        step = min(self.elapsed.restart() / 16.0, 4.0)
+        if not self.isVisible():
+            return
+        self.angle1 = (self.angle1 + (0.5 + self.mouse_influence_y * 0.1) * step) % 360
+        self.angle2 = (self.angle2 + (0.8 + self.mouse_influence_x * 0.1) * step) % 360
+        self.angle3 = (self.angle3 - 0.3 * step) % 360
         
-        self.core_pulse_size += 0.01 * self.core_pulse_direction
+        self.core_pulse_size += 0.01 * self.core_pulse_direction * step
         if not 0.8 < self.core_pulse_size < 1.2: self.core_pulse_direction *= -1
 
-        self.scan_line_y += self.scan_line_dir
+        self.scan_line_y += self.scan_line_dir * step
         if not -1.0 < self.scan_line_y < 1.0: self.scan_line_dir *= -1
             
-        for p in self.particles: p["angle"] = (p["angle"] + p["speed"]) % 360
-        self.update()
+        self.particle_angle = (self.particle_angle + self.particle_speed * step) % 360
+        self.update(self.sphere_rect())
+    
+    def sphere_rect(self):
+        """Bounding rect of everything paintEvent draws: outer glow, orbiting particles and sheared rings"""
+        center, radius = self.rect().center(), min(self.width(), self.height()) / 3.5
+        extent = int(radius * 1.5) + 4
+        return QRect(center.x() - extent, center.y() - extent, 2 * extent, 2 * extent)
 
     def mouseMoveEvent(self, event):
         # Make the sphere react to mouse position
@@ -189,13 +256,15 @@ class HolographicSphere(QWidget):
 
         # Orbiting particles
         painter.setPen(Qt.PenStyle.NoPen)
-        for p in self.particles:
-            pr = radius * p["radius_factor"]
-            px = center.x() + pr * math.cos(math.radians(p["angle"]))
-            py = center.y() + pr * math.sin(math.radians(p["angle"]))
-            alpha = int(100 + 155 * abs(math.sin(math.radians(p["angle"]*2))))
-            painter.setBrush(QColor(200, 255, 255, alpha))
-            painter.drawEllipse(QPointF(px, py), p["size"], p["size"])
+        rad = np.deg2rad(self.particle_angle)
+        pr = radius * self.particle_radius_factor
+        xs = (center.x() + pr * np.cos(rad)).tolist()
+        ys = (center.y() + pr * np.sin(rad)).tolist()
+        alphas = (100 + 155 * np.abs(np.sin(2 * rad))).astype(np.int32).tolist()
+        for px, py, alpha, size in zip(xs, ys, alphas, self.particle_size):
+            self.particle_color.setAlpha(alpha)
+            painter.setBrush(self.particle_color)
+            painter.drawEllipse(QPointF(px, py), size, size)
 
         # Pulsing Core
         core_gradient = QLinearGradient(center.x(), center.y() - radius/2, center.x(), center.y() + radius/2)
@@ -217,37 +286,63 @@ class HUDOverlay(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.pen = QPen(QColor(0, 247, 255, 100), 2)
+        self.lines = []
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        pen = QPen(QColor(0, 247, 255, 100), 2)
-        painter.setPen(pen)
-        
+    def resizeEvent(self, event):
         w, h, p = self.width(), self.height(), 20 # width, height, padding
         l = 30 # line length
         
-        # Top-left
-        painter.drawLine(p, p, p + l, p)
-        painter.drawLine(p, p, p, p + l)
-        # Top-right
-        painter.drawLine(w - p, p, w - p - l, p)
-        painter.drawLine(w - p, p, w - p, p + l)
-        # Bottom-left
-        painter.drawLine(p, h - p, p + l, h - p)
-        painter.drawLine(p, h - p, p, h - p - l)
-        # Bottom-right
-        painter.drawLine(w - p, h - p, w - p - l, h - p)
-        painter.drawLine(w - p, h - p, w - p, h - p - l)
+        self.lines = [
+            # Top-left
+            QLineF(p, p, p + l, p), QLineF(p, p, p, p + l),
+            # Top-right
+            QLineF(w - p, p, w - p - l, p), QLineF(w - p, p, w - p, p + l),
+            # Bottom-left
+            QLineF(p, h - p, p + l, h - p), QLineF(p, h - p, p, h - p - l),
+            # Bottom-right
+            QLineF(w - p, h - p, w - p - l, h - p), QLineF(w - p, h - p, w - p, h - p - l),
+        ]
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.pen)
+        painter.drawLines(self.lines)
 
 # Main Login Window
 class TIYALogin(QWidget):
+    login_requested = pyqtSignal(str, str)  # Emitted with (username, password) after the verifying pause
+    
+    # Parsed once per window in init_ui; status changes re-polish instead of re-applying it
+    _STYLESHEET = """
+        QFrame#mainFrame { background: transparent; }
+        QFrame#leftPanel { background-color: rgba(10, 15, 25, 150); border-right: 1px solid rgba(0, 247, 255, 50); }
+        QFrame#rightPanel { background-color: rgba(10, 15, 25, 200); }
+        QLabel { color: rgba(0, 247, 255, 180); background: transparent; font-family: 'Courier New', monospace; font-size: 11px; font-weight: bold; }
+        QLabel#title { font-family: 'Orbitron', sans-serif; font-size: 52px; font-weight: bold; color: #ffffff; text-shadow: 0 0 25px #00f7ff; letter-spacing: 10px; margin-bottom: -10px; }
+        QLabel#subtitle { font-family: 'Courier New', monospace; font-size: 12px; font-style: italic; margin-bottom: 20px; }
+        QLabel#status[state="online"], QLabel#status[state="granted"] { color: #00ff88; text-shadow: 0 0 8px #00ff88; }
+        QLabel#status[state="verifying"] { color: #ffff00; text-shadow: 0 0 8px #ffff00; }
+        QLabel#status[state="denied"] { color: #ff2222; text-shadow: 0 0 10px #ff2222; font-weight: bold; }
+        QLabel#footer { color: rgba(0, 247, 255, 100); font-size: 9px; }
+        QLineEdit { background: rgba(0, 0, 0, 100); border: 1px solid rgba(0, 247, 255, 80); border-radius: 8px; padding: 12px 15px; color: #e0ffff; font-size: 14px; font-family: 'Courier New', monospace; }
+        QLineEdit:focus { border: 1px solid #00f7ff; background: rgba(0, 20, 30, 150); }
+        QLineEdit::placeholder { color: rgba(0, 247, 255, 100); }
+        QPushButton { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #00f7ff, stop:1 #008c9e); color: #05080f; border: none; border-radius: 8px; font-weight: bold; font-size: 16px; font-family: 'Orbitron', sans-serif; padding: 12px 25px; letter-spacing: 2px; }
+        QPushButton:hover { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ffffff, stop:1 #00f7ff); color: #000000; }
+        QPushButton#glowingButton { border: 2px solid rgba(0, 247, 255, 120); }
+        QPushButton#glowingButton:hover { border: 2px solid rgba(0, 247, 255, 220); }
+    """
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("TIYA - Transcendent Intelligence Yielding Assistant")
         self.setFixedSize(960, 720)
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self._glitch_dx = 0
         
         self.init_ui()
         self.setup_animations()
@@ -274,7 +369,10 @@ class TIYALogin(QWidget):
 
         left_panel = QFrame(); left_panel.setObjectName("leftPanel")
         left_vbox = QVBoxLayout(left_panel); left_vbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.avatar = HolographicSphere(); left_vbox.addWidget(self.avatar)
+        # The sphere is built once the window has faded in (see run_boot_sequence)
+        self.left_vbox = left_vbox
+        self.avatar = None
+        self.avatar_placeholder = QWidget(); self.avatar_placeholder.setMinimumSize(300, 300); left_vbox.addWidget(self.avatar_placeholder)
         
         right_panel = QFrame(); right_panel.setObjectName("rightPanel")
         right_vbox = QVBoxLayout(right_panel); right_vbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -283,7 +381,7 @@ class TIYALogin(QWidget):
         self.title = QLabel("T.I.Y.A."); self.title.setObjectName("title"); self.title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.subtitle = PulsingLabel("Transcendent Intelligence Yielding Assistant"); self.subtitle.setObjectName("subtitle"); self.subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        self.status = QLabel(""); self.status.setObjectName("statusOnline"); self.status.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.status = QLabel(""); self.status.setObjectName("status"); self.status.setProperty("state", "online"); self.status.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         self.id_label = QLabel("NEURAL IDENTIFICATION:"); self.key_label = QLabel("BIOMETRIC KEY:")
         self.username = QLineEdit(); self.username.setPlaceholderText("Quantum Entanglement ID")
@@ -298,30 +396,11 @@ class TIYALogin(QWidget):
         right_vbox.addStretch(); right_vbox.addWidget(footer)
 
         main_hbox.addWidget(left_panel, 4); main_hbox.addWidget(right_panel, 6)
-        self.setStyleSheet(self.get_stylesheet())
+        self.setStyleSheet(TIYALogin._STYLESHEET)
         
         self.animatable_widgets = [self.title, self.subtitle, self.id_label, self.username, self.key_label, self.password, self.login_btn]
         for widget in self.animatable_widgets: widget.setVisible(False)
 
-    def get_stylesheet(self):
-        return """
-            QFrame#mainFrame { background: transparent; }
-            QFrame#leftPanel { background-color: rgba(10, 15, 25, 150); border-right: 1px solid rgba(0, 247, 255, 50); }
-            QFrame#rightPanel { background-color: rgba(10, 15, 25, 200); }
-            QLabel { color: rgba(0, 247, 255, 180); background: transparent; font-family: 'Courier New', monospace; font-size: 11px; font-weight: bold; }
-            QLabel#title { font-family: 'Orbitron', sans-serif; font-size: 52px; font-weight: bold; color: #ffffff; text-shadow: 0 0 25px #00f7ff; letter-spacing: 10px; margin-bottom: -10px; }
-            QLabel#subtitle { font-family: 'Courier New', monospace; font-size: 12px; font-style: italic; margin-bottom: 20px; }
-            QLabel#statusOnline, QLabel#statusGranted { color: #00ff88; text-shadow: 0 0 8px #00ff88; }
-            QLabel#statusVerifying { color: #ffff00; text-shadow: 0 0 8px #ffff00; }
-            QLabel#statusDenied { color: #ff2222; text-shadow: 0 0 10px #ff2222; font-weight: bold; }
-            QLabel#footer { color: rgba(0, 247, 255, 100); font-size: 9px; }
-            QLineEdit { background: rgba(0, 0, 0, 100); border: 1px solid rgba(0, 247, 255, 80); border-radius: 8px; padding: 12px 15px; color: #e0ffff; font-size: 14px; font-family: 'Courier New', monospace; }
-            QLineEdit:focus { border: 1px solid #00f7ff; background: rgba(0, 20, 30, 150); }
-            QLineEdit::placeholder { color: rgba(0, 247, 255, 100); }
-            QPushButton { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #00f7ff, stop:1 #008c9e); color: #05080f; border: none; border-radius: 8px; font-weight: bold; font-size: 16px; font-family: 'Orbitron', sans-serif; padding: 12px 25px; letter-spacing: 2px; }
-            QPushButton:hover { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ffffff, stop:1 #00f7ff); color: #000000; }
-        """
-
     def setup_animations(self):
         self.fade_animation = QPropertyAnimation(self, b"windowOpacity")
         self.fade_animation.setDuration(1500)
@@ -332,6 +411,9 @@ class TIYALogin(QWidget):
         self.fade_animation.start()
 
     def run_boot_sequence(self):
+        self.avatar = HolographicSphere()
+        self.left_vbox.replaceWidget(self.avatar_placeholder, self.avatar)
+        self.avatar_placeholder.deleteLater()
         self.boot_texts = ["INITIALIZING NEURAL INTERFACE...", "CALIBRATING QUANTUM LINK...", "SYSTEM STATUS: ONLINE"]
         self.boot_timer = QTimer()
         self.boot_timer.timeout.connect(self.update_boot_text)
@@ -345,14 +427,24 @@ class TIYALogin(QWidget):
             self.run_slide_animations()
 
     def run_slide_animations(self):
-        self.anim_group = QParallelAnimationGroup()
+        # One group started once; each widget's fade+slide waits behind its own pause
+        self.anim_group = QParallelAnimationGroup(self)
+        self.fade_effects = []
         for i, widget in enumerate(self.animatable_widgets):
             widget.setVisible(True)
-            # Opacity animation
-            opacity_anim = QPropertyAnimation(widget, b"windowOpacity")
-            opacity_anim.setDuration(500)
-            opacity_anim.setStartValue(0.0)
-            opacity_anim.setEndValue(1.0)
+            pair = QParallelAnimationGroup()
+            # Opacity animation: windowOpacity only affects top-level windows, so fade
+            # child widgets through an effect (PulsingLabel already owns one)
+            if widget.graphicsEffect() is None:
+                effect = QGraphicsOpacityEffect(widget)
+                effect.setOpacity(0.0)
+                widget.setGraphicsEffect(effect)
+                self.fade_effects.append(widget)
+                opacity_anim = QPropertyAnimation(effect, b"opacity")
+                opacity_anim.setDuration(500)
+                opacity_anim.setStartValue(0.0)
+                opacity_anim.setEndValue(1.0)
+                pair.addAnimation(opacity_anim)
             # Position animation
             pos_anim = QPropertyAnimation(widget, b"pos")
             pos_anim.setDuration(600)
@@ -360,47 +452,67 @@ class TIYALogin(QWidget):
             pos_anim.setStartValue(QPointF(start_pos.x() + 50, start_pos.y()))
             pos_anim.setEndValue(start_pos)
             pos_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-            # Add to group with a delay
-            self.anim_group.addAnimation(opacity_anim)
-            self.anim_group.addAnimation(pos_anim)
-            QTimer.singleShot(i * 70, lambda anim=self.anim_group: anim.start())
+            pair.addAnimation(pos_anim)
+            # Stagger each widget by 70 ms
+            staggered = QSequentialAnimationGroup()
+            staggered.addPause(i * 70)
+            staggered.addAnimation(pair)
+            self.anim_group.addAnimation(staggered)
+        self.anim_group.finished.connect(self.clear_fade_effects)
+        self.anim_group.start()
+
+    def clear_fade_effects(self):
+        """Drop the fade-in effects once they are done so the widgets paint directly again"""
+        for widget in self.fade_effects:
+            widget.setGraphicsEffect(None)
+        self.fade_effects = []
+
+    def set_status(self, text, state):
+        """Show a status line; state selects a QLabel#status[state=...] rule in the stylesheet"""
+        self.status.setText(text)
+        # Re-polishing restyles the label without reparsing the window stylesheet
+        self.status.setProperty("state", state)
+        self.status.style().unpolish(self.status)
+        self.status.style().polish(self.status)
 
     def handle_login(self):
-        self.status.setText("● VERIFYING COGNITIVE SIGNATURE...")
-        self.status.setObjectName("statusVerifying")
-        self.setStyleSheet(self.get_stylesheet())
-        QTimer.singleShot(2000, lambda: self.process_login(self.username.text().lower(), self.password.text()))
+        self.set_status("● VERIFYING COGNITIVE SIGNATURE...", "verifying")
+        QTimer.singleShot(2000, lambda: self.login_requested.emit(self.username.text().lower(), self.password.text()))
 
     def process_login(self, user, pwd):
-        # UPDATED: Added new user credentials as requested.
-        valid_users = {"daksh lohchab": "886", "operator": "quantum", "admin": "singularity", "tiya": "protocol"}
-        if user in valid_users and pwd == valid_users[user]:
-            self.status.setText("● CONNECTION ESTABLISHED. WELCOME.")
-            self.status.setObjectName("statusGranted")
+        """Standalone login handling, used when this window runs on its own"""
+        if check_credentials(user, pwd):
+            self.set_status("● CONNECTION ESTABLISHED. WELCOME.", "granted")
             self.show_message_box("Access Granted", f"Welcome, {user.title()}.\nNeural link synchronized.", "success")
         else:
-            self.status.setText("● AUTHENTICATION FAILURE. ANOMALY DETECTED.")
-            self.status.setObjectName("statusDenied")
+            self.set_status("● AUTHENTICATION FAILURE. ANOMALY DETECTED.", "denied")
             self.glitch_effect()
             self.show_message_box("Access Denied", "Cognitive signature mismatch.\nSecurity protocols engaged.", "failure")
             QTimer.singleShot(2500, self.reset_status)
-        self.setStyleSheet(self.get_stylesheet())
+
+    @pyqtProperty(int)
+    def glitch_dx(self):
+        return self._glitch_dx
+
+    @glitch_dx.setter
+    def glitch_dx(self, value):
+        # Shake the content frame inside the window rather than moving the window itself
+        self._glitch_dx = value
+        self.main_frame.move(value, 0)
 
     def glitch_effect(self):
-        self.glitch_anim = QPropertyAnimation(self, b"pos")
+        self.glitch_anim = QPropertyAnimation(self, b"glitch_dx")
         self.glitch_anim.setDuration(200)
-        start_pos = self.pos()
-        self.glitch_anim.setKeyValueAt(0, start_pos)
-        self.glitch_anim.setKeyValueAt(0.1, start_pos + QPointF(5, 0))
-        self.glitch_anim.setKeyValueAt(0.2, start_pos + QPointF(-5, 0))
-        self.glitch_anim.setKeyValueAt(0.3, start_pos + QPointF(5, 0))
-        self.glitch_anim.setKeyValueAt(0.4, start_pos)
+        self.glitch_anim.setKeyValueAt(0, 0)
+        self.glitch_anim.setKeyValueAt(0.1, 5)
+        self.glitch_anim.setKeyValueAt(0.2, -5)
+        self.glitch_anim.setKeyValueAt(0.3, 5)
+        self.glitch_anim.setKeyValueAt(0.4, 0)
+        self.glitch_anim.setKeyValueAt(1, 0)
         self.glitch_anim.start()
 
     def reset_status(self):
-        self.status.setText("● SYSTEM STATUS: ONLINE")
-        self.status.setObjectName("statusOnline")
-        self.setStyleSheet(self.get_stylesheet())
+        self.set_status("● SYSTEM STATUS: ONLINE", "online")
         self.username.clear(); self.password.clear()
 
     def show_message_box(self, title, text, msg_type="success"):
@@ -425,6 +537,7 @@ class TIYALogin(QWidget):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = TIYALogin()
+    window.login_requested.connect(window.process_login)
     screen_geometry = app.primaryScreen().geometry()
     x = (screen_geometry.width() - window.width()) // 2
     y = (screen_geometry.height() - window.height()) // 2
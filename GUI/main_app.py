@@ -1,24 +1,58 @@
 import sys
 import os
+import logging
 from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 
 # Import your custom modules
-from login import TIYALogin
+from login import TIYALogin, check_credentials
 from main_assistant import EnhancedTIYAAssistant
 from firebase_manager import firebase_manager
 
+class FirebaseTaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+class FirebaseTask(QRunnable):
+    """Runs a blocking firebase_manager call on the global thread pool"""
+    def __init__(self, func, *args, signals=None):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.signals = signals
+    
+    def run(self):
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            if self.signals:
+                self.signals.failed.emit(str(e))
+            return
+        if self.signals:
+            self.signals.finished.emit(result)
+
 class TIYAApplication:
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.current_user = None
         self.api_key = None
         
+        # Firestore round-trips run off the GUI thread and report back here
+        self.api_key_signals = FirebaseTaskSignals()
+        self.api_key_signals.finished.connect(self.handle_api_key_result)
+        self.api_key_signals.failed.connect(self.handle_api_key_error)
+        self.api_store_signals = FirebaseTaskSignals()
+        self.api_store_signals.finished.connect(self.handle_api_key_stored)
+        self.api_store_signals.failed.connect(self.handle_api_key_store_error)
+        
         # Windows
         self.login_window = None
         self.api_setup_window = None
         self.assistant_window = None
         
+        # Queued chat history writes flush themselves; send any leftovers before exit
+        self.app.aboutToQuit.connect(firebase_manager.close_chat_history)
+        
         self.start_application()
     
     def start_application(self):
@@ -29,9 +63,7 @@ class TIYAApplication:
         """Show the login window"""
         self.login_window = TIYALogin()
         
-        # Override the login process to integrate with our flow
-        original_process_login = self.login_window.process_login
-        self.login_window.process_login = self.handle_login
+        self.login_window.login_requested.connect(self.handle_login)
         
         # Center and show
         self.center_window(self.login_window)
@@ -39,32 +71,21 @@ class TIYAApplication:
     
     def handle_login(self, username, password):
         """Handle login process with Firebase integration"""
-        # Valid users (you can expand this or move to Firebase)
-        valid_users = {
-            "daksh lohchab": "886", 
-            "operator": "quantum", 
-            "admin": "singularity", 
-            "tiya": "protocol"
-        }
-        
-        if username in valid_users and password == valid_users[username]:
+        if check_credentials(username, password):
             self.current_user = username
             
             # Update login status
-            self.login_window.status.setText("● CONNECTION ESTABLISHED. CHECKING NEURAL KEYS...")
-            self.login_window.status.setObjectName("statusGranted")
-            self.login_window.setStyleSheet(self.login_window.get_stylesheet())
+            self.login_window.set_status("● CONNECTION ESTABLISHED. CHECKING NEURAL KEYS...", "granted")
             
             # Update last login in Firebase
-            firebase_manager.update_user_last_login(username)
+            QThreadPool.globalInstance().start(FirebaseTask(firebase_manager.update_user_last_login, username))
             
             # Check if user has API key stored
             QTimer.singleShot(1500, self.check_user_api_key)
             
         else:
             # Handle failed login (keep original behavior)
-            self.login_window.status.setText("● AUTHENTICATION FAILURE. ANOMALY DETECTED.")
-            self.login_window.status.setObjectName("statusDenied")
+            self.login_window.set_status("● AUTHENTICATION FAILURE. ANOMALY DETECTED.", "denied")
             self.login_window.glitch_effect()
             self.login_window.show_message_box(
                 "Access Denied", 
@@ -72,41 +93,46 @@ class TIYAApplication:
                 "failure"
             )
             QTimer.singleShot(2500, self.login_window.reset_status)
-            self.login_window.setStyleSheet(self.login_window.get_stylesheet())
     
     def check_user_api_key(self):
         """Check if user has API key stored in Firebase"""
-        try:
-            api_key, message = firebase_manager.get_user_api_key(self.current_user)
-            
-            if api_key:
-                # User has API key, go directly to main assistant
-                self.api_key = api_key
-                self.login_window.show_message_box(
-                    "Welcome Back", 
-                    f"Neural link synchronized, {self.current_user.title()}.\nAccessing T.I.Y.A. interface...", 
-                    "success"
-                )
-                QTimer.singleShot(2000, self.show_main_assistant)
-            else:
-                # User doesn't have API key, show API setup
-                self.login_window.show_message_box(
-                    "Neural Key Required", 
-                    f"Welcome, {self.current_user.title()}.\nAPI configuration required for full capabilities.", 
-                    "success"
-                )
-                QTimer.singleShot(2000, self.show_api_setup)
-                
-        except Exception as e:
-            print(f"Error checking API key: {e}")
-            # If Firebase fails, show API setup
+        QThreadPool.globalInstance().start(
+            FirebaseTask(firebase_manager.get_user_api_key, self.current_user, signals=self.api_key_signals)
+        )
+    
+    def handle_api_key_result(self, result):
+        """Route to the assistant or API setup once the stored key lookup returns"""
+        api_key, message = result
+        
+        if api_key:
+            # User has API key, go directly to main assistant
+            self.api_key = api_key
+            self.login_window.show_message_box(
+                "Welcome Back", 
+                f"Neural link synchronized, {self.current_user.title()}.\nAccessing T.I.Y.A. interface...", 
+                "success"
+            )
+            QTimer.singleShot(2000, self.show_main_assistant)
+        else:
+            # User doesn't have API key, show API setup
             self.login_window.show_message_box(
-                "System Notice", 
-                f"Welcome, {self.current_user.title()}.\nLocal API configuration required.", 
+                "Neural Key Required", 
+                f"Welcome, {self.current_user.title()}.\nAPI configuration required for full capabilities.", 
                 "success"
             )
             QTimer.singleShot(2000, self.show_api_setup)
     
+    def handle_api_key_error(self, error):
+        """Fall back to local API setup when the Firebase lookup fails"""
+        print(f"Error checking API key: {error}")
+        # If Firebase fails, show API setup
+        self.login_window.show_message_box(
+            "System Notice", 
+            f"Welcome, {self.current_user.title()}.\nLocal API configuration required.", 
+            "success"
+        )
+        QTimer.singleShot(2000, self.show_api_setup)
+    
     def show_api_setup(self):
         """Show API setup window"""
         self.login_window.close()
@@ -122,16 +148,25 @@ class TIYAApplication:
         self.api_key = api_key
         
         if api_key:
-            # Store API key in Firebase
-            success, message = firebase_manager.store_user_api_key(self.current_user, api_key)
-            if success:
-                print(f"API key stored in Firebase: {message}")
-            else:
-                print(f"Failed to store API key: {message}")
+            # Store API key in Firebase without holding up the assistant
+            QThreadPool.globalInstance().start(FirebaseTask(
+                firebase_manager.store_user_api_key, self.current_user, api_key, signals=self.api_store_signals
+            ))
         
         # Show main assistant
         self.show_main_assistant()
     
+    def handle_api_key_stored(self, result):
+        """Report the outcome of saving the API key to Firebase"""
+        success, message = result
+        if success:
+            print(f"API key stored in Firebase: {message}")
+        else:
+            print(f"Failed to store API key: {message}")
+    
+    def handle_api_key_store_error(self, error):
+        print(f"Failed to store API key: {error}")
+    
     def show_main_assistant(self):
         """Show the main T.I.Y.A. assistant"""
         if self.api_setup_window:
@@ -159,5 +194,6 @@ class TIYAApplication:
         return self.app.exec_()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(threadName)s: %(message)s")
     tiya_app = TIYAApplication()
     sys.exit(tiya_app.run())
\ No newline at end of file
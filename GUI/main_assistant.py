@@ -2,17 +2,22 @@ import sys
 import json
 import os
 import threading
+import time
+import queue
+import logging
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout,
-    QHBoxLayout, QScrollArea, QFrame
+    QHBoxLayout, QFrame, QListView, QStyledItemDelegate
 )
 from PyQt5.QtGui import (
     QFont, QPixmap, QPalette, QColor, QPainter, QBrush, QLinearGradient, QPen,
-    QTextCursor, QImage, QFontDatabase, QRadialGradient
+    QTextCursor, QImage, QFontDatabase, QRadialGradient, QFontMetrics, QGradient,
+    QStaticText, QTransform, QPainterPath
 )
 from PyQt5.QtCore import (
-    Qt, QTimer, QPointF, QThread, pyqtSignal, QSize, QRect
+    Qt, QTimer, QElapsedTimer, QPointF, QLineF, QThread, pyqtSignal, QSize, QRect,
+    QRectF, QObject, QRunnable, QThreadPool, QAbstractListModel, QModelIndex
 )
 import math
 import random
@@ -35,12 +40,17 @@ except ImportError:
     GEMINI_AVAILABLE = False
     print("Warning: google-generativeai not installed. Using mock responses.")
 
+# Background threads log here rather than print; handlers are configured by the entry point
+log = logging.getLogger("tiya")
+
 # --- WAKE WORD LISTENER THREAD ---
 class WakeWordListener(QThread):
     """
     A QThread that continuously listens for a wake word in the background.
     """
     wakeWordDetected = pyqtSignal()
+    commandHeard = pyqtSignal(str)
+    commandFailed = pyqtSignal(str)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -50,11 +60,11 @@ class WakeWordListener(QThread):
 
     def run(self):
         if not AUDIO_AVAILABLE:
-            print("Wake word listener disabled: Audio libraries not available.")
+            log.info("Wake word listener disabled: Audio libraries not available.")
             return
 
         self.running = True
-        print("Wake word listener started. Say 'Tiya' to activate.")
+        log.info("Wake word listener started. Say 'Tiya' to activate.")
         with self.microphone as source:
             self.recognizer.adjust_for_ambient_noise(source, duration=1.0)
             self.recognizer.dynamic_energy_threshold = True
@@ -65,24 +75,96 @@ class WakeWordListener(QThread):
                     text = self.recognizer.recognize_google(audio).lower()
 
                     if "tiya" in text:
-                        print("Wake word 'Tiya' detected!")
+                        log.debug("Wake word 'Tiya' detected!")
                         self.wakeWordDetected.emit()
+                        self.listen_for_command(source)
                 except sr.UnknownValueError:
                     pass # Ignore if it can't understand
                 except sr.RequestError as e:
-                    print(f"Could not request results from Google Speech Recognition service; {e}")
+                    log.warning("Could not request results from Google Speech Recognition service; %s", e)
                 except Exception as e:
-                    print(f"An error occurred in wake word listener: {e}")
+                    log.warning("An error occurred in wake word listener: %s", e)
+
+    def listen_for_command(self, source):
+        """Record and recognize one command on the already open and calibrated microphone"""
+        try:
+            audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
+            self.commandHeard.emit(self.recognizer.recognize_google(audio))
+        except (sr.WaitTimeoutError, sr.UnknownValueError, sr.RequestError) as e:
+            self.commandFailed.emit(f"Voice input error: {type(e).__name__}")
 
     def stop(self):
         self.running = False
-        print("Wake word listener stopped.")
+        log.info("Wake word listener stopped.")
         self.quit()
         self.wait(2000) # Wait up to 2 seconds for thread to finish
 
+# --- WEBCAM CAPTURE THREAD ---
+class CaptureThread(QThread):
+    """
+    Reads the webcam continuously off the GUI thread, keeping only the newest frame.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cap = cv2.VideoCapture(0)
+        # Keep the driver queue short so reads don't return stale frames
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # The feed is shown at 140x140, so ask for a small MJPEG stream instead of full-size raw YUYV
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 320)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 240)
+        self.cap.set(cv2.CAP_PROP_FPS, 30)
+        self.frame_lock = threading.Lock()
+        self.latest_frame = None
+        # Set when the GUI has consumed the last frame; only then is the next one decoded
+        self.frame_wanted = threading.Event()
+        self.frame_wanted.set()
+        self.running = False
+
+    def run(self):
+        self.running = True
+        while self.running and self.cap.isOpened():
+            # grab() keeps the driver queue drained; retrieve() decodes only frames the GUI will show
+            if not self.cap.grab():
+                time.sleep(0.1)
+                continue
+            if not self.frame_wanted.is_set():
+                continue
+            ret, frame = self.cap.retrieve()
+            if ret:
+                self.frame_wanted.clear()
+                with self.frame_lock:
+                    self.latest_frame = frame
+
+    def take_frame(self):
+        """Return the newest unseen frame, or None if none arrived since the last call"""
+        with self.frame_lock:
+            frame, self.latest_frame = self.latest_frame, None
+        if frame is not None:
+            self.frame_wanted.set()
+        return frame
+
+    def stop(self):
+        self.running = False
+        self.wait(2000)
+        if self.cap.isOpened():
+            self.cap.release()
+
 # --- GUI WIDGETS (CircularHUD, EnhancedWebcamFeed, etc.) ---
 
 class CircularHUD(QWidget):
+    # Unit vectors of the 32 evenly spaced audio bars before rotation
+    BAR_COS = np.cos(np.arange(32) * (2 * np.pi / 32))
+    BAR_SIN = np.sin(np.arange(32) * (2 * np.pi / 32))
+    LEVEL_TIERS = 8
+    # Simulated voice activity: 128 phases of a travelling sine across the bars, in 0.3-0.7
+    FAKE_LEVELS = (0.3 + 0.4 * np.abs(np.sin(np.linspace(0, 8 * np.pi, 128)[:, None]
+                                             + np.linspace(0, 2 * np.pi, 32)[None, :]))).astype(np.float32)
+    ANIMATED_STATUSES = ("LISTENING", "SPEAKING")
+    # Frame interval in ms: full rate while active, a slow idle spin in STANDBY
+    ACTIVE_INTERVAL = 16
+    IDLE_INTERVAL = 50
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(280, 280)
@@ -91,82 +173,211 @@ class CircularHUD(QWidget):
         self.audio_levels = [0] * 32
         self.status = "STANDBY" # Can be STANDBY, LISTENING, SPEAKING, PROCESSING
 
+        # Paint-time objects are built once and reused every frame; the static
+        # ring and core are pre-rendered on first paint
+        self.ring_pixmap = None
+        self.core_pixmap = None
+        self.bar_pens = {
+            status: [QPen(QColor(r, g, b, int(150 + (tier + 0.5) / self.LEVEL_TIERS * 105)), 2)
+                     for tier in range(self.LEVEL_TIERS)]
+            for status, (r, g, b) in (("LISTENING", (0, 255, 100)), ("SPEAKING", (255, 100, 0)))
+        }
+        self.status_colors = {
+            "LISTENING": QColor(0, 255, 100),
+            "SPEAKING": QColor(255, 100, 0),
+            "PROCESSING": QColor(255, 200, 0),
+        }
+        self.default_status_color = QColor(0, 247, 255)
+        self.status_font = QFont("Orbitron", 10, QFont.Bold)
+
+        # Motion advances by measured time, in units of the nominal 16 ms tick
+        self.elapsed = QElapsedTimer()
+        self.elapsed.start()
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.animate)
-        self.timer.start(16)  # ~60 FPS
+        self.timer.setInterval(self.IDLE_INTERVAL)  # runs only while shown
+        # Steps through FAKE_LEVELS while listening or speaking
+        self.level_phase = 0
+        self.level_timer = QTimer(self)
+        self.level_timer.timeout.connect(self.advance_levels)
+        self.level_timer.setInterval(100)
+
+    def showEvent(self, event):
+        self.elapsed.restart()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
 
     def set_status(self, status):
         """Sets the current status of the HUD"""
         self.status = status.upper()
+        self.timer.setInterval(self.IDLE_INTERVAL if self.status == "STANDBY" else self.ACTIVE_INTERVAL)
+        if self.status in self.ANIMATED_STATUSES and not self.level_timer.isActive():
+            self.level_timer.start()
         self.update()
 
+    def advance_levels(self):
+        if self.status not in self.ANIMATED_STATUSES:
+            self.level_timer.stop()
+            self.audio_levels = [0] * 32
+            return
+        self.audio_levels = self.FAKE_LEVELS[self.level_phase % len(self.FAKE_LEVELS)]
+        self.level_phase += 1
+
     def set_audio_levels(self, levels):
         self.audio_levels = levels[:32] if len(levels) >= 32 else levels + [0] * (32 - len(levels))
 
     def animate(self):
-        self.rotation = (self.rotation + 0.5) % 360
-        self.pulse = (self.pulse + 2) % 360
-        self.update()
+        step = min(self.elapsed.restart() / 16.0, 4.0)
+        self.rotation = (self.rotation + 0.5 * step) % 360
+        self.pulse = (self.pulse + 2 * step) % 360
+        # Nothing on screen to refresh (obscured or minimized)
+        if not self.visibleRegion().isEmpty():
+            self.update()
+
+    def new_pixmap(self):
+        """Return a transparent widget-sized pixmap at the screen's pixel ratio"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(QSize(int(self.width() * ratio), int(self.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+
+    def render_ring(self):
+        """Render the unrotated outer ring segments (like in reference image)"""
+        pixmap = self.new_pixmap()
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        accent_pen, dim_pen = QPen(QColor(0, 247, 255, 200), 2), QPen(QColor(80, 80, 100, 150), 2)
+        ring_rect = QRect(10, 10, 260, 260)
+        for i in range(0, 360, 10):
+            painter.setPen(accent_pen if i % 30 == 0 else dim_pen)
+            painter.drawArc(ring_rect, i * 16, 8 * 16)
+        painter.end()
+        return pixmap
+
+    def render_core(self):
+        """Render the central core disc"""
+        pixmap = self.new_pixmap()
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        gradient = QRadialGradient(QPointF(140, 140), 70)
+        gradient.setColorAt(0, QColor(0, 247, 255, 200))
+        gradient.setColorAt(0.7, QColor(0, 150, 200, 100))
+        gradient.setColorAt(1, QColor(0, 50, 80, 50))
+        painter.setBrush(QBrush(gradient))
+        painter.setPen(QPen(QColor(0, 247, 255, 150), 2))
+        painter.drawEllipse(QPointF(140, 140), 70, 70)
+        painter.end()
+        return pixmap
 
     def paintEvent(self, event):
+        if self.ring_pixmap is None or self.ring_pixmap.devicePixelRatio() != self.devicePixelRatioF():
+            self.ring_pixmap = self.render_ring()
+            self.core_pixmap = self.render_core()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
         center = QPointF(140, 140)
 
-        # Draw outer ring segments (like in reference image)
-        painter.setPen(QPen(QColor(60, 60, 80), 2))
-        for i in range(0, 360, 10):
-            start_angle = i + self.rotation
-            color = QColor(0, 247, 255, 200) if i % 30 == 0 else QColor(80, 80, 100, 150)
-            painter.setPen(QPen(color, 2))
-            painter.drawArc(QRect(10, 10, 260, 260), int(start_angle * 16), 8 * 16)
+        # Arc angles run counter-clockwise, painter rotation clockwise
+        painter.translate(center)
+        painter.rotate(-self.rotation)
+        painter.drawPixmap(-140, -140, self.ring_pixmap)
+        painter.resetTransform()
 
         # Draw audio visualization ring
-        if self.status in ["LISTENING", "SPEAKING"]:
-            for i, level in enumerate(self.audio_levels):
-                angle = (i * 360 / len(self.audio_levels)) + self.rotation
-                level_height = max(3, level * 20)
-                color = QColor(0, 255, 100) if self.status == "LISTENING" else QColor(255, 100, 0)
-                color.setAlpha(int(150 + level * 105))
-                painter.setPen(QPen(color, 2))
-                inner_r, outer_r = 105, 105 + level_height
-                x1, y1 = center.x() + inner_r * math.cos(math.radians(angle)), center.y() + inner_r * math.sin(math.radians(angle))
-                x2, y2 = center.x() + outer_r * math.cos(math.radians(angle)), center.y() + outer_r * math.sin(math.radians(angle))
-                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+        if self.status in self.ANIMATED_STATUSES:
+            # Rotate the precomputed bar directions by angle addition: two trig calls per frame
+            rot = math.radians(self.rotation)
+            cos_r, sin_r = math.cos(rot), math.sin(rot)
+            cos_a = self.BAR_COS * cos_r - self.BAR_SIN * sin_r
+            sin_a = self.BAR_SIN * cos_r + self.BAR_COS * sin_r
+            levels = np.asarray(self.audio_levels, dtype=np.float64)
+            outer_r = 105 + np.maximum(3, levels * 20)
+            x1, y1 = 140 + 105 * cos_a, 140 + 105 * sin_a
+            x2, y2 = 140 + outer_r * cos_a, 140 + outer_r * sin_a
+            # Group bars into alpha tiers so each tier is one pen and one drawLines call
+            tiers = np.clip((levels * self.LEVEL_TIERS).astype(np.int32), 0, self.LEVEL_TIERS - 1)
+            segments = np.column_stack((x1, y1, x2, y2)).tolist()
+            for tier, pen in enumerate(self.bar_pens[self.status]):
+                lines = [QLineF(*segments[i]) for i in np.flatnonzero(tiers == tier)]
+                if lines:
+                    painter.setPen(pen)
+                    painter.drawLines(lines)
 
         # Central core and status text
-        gradient = QRadialGradient(center, 70)
-        gradient.setColorAt(0, QColor(0, 247, 255, 200))
-        gradient.setColorAt(0.7, QColor(0, 150, 200, 100))
-        gradient.setColorAt(1, QColor(0, 50, 80, 50))
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(QPen(QColor(0, 247, 255, 150), 2))
-        painter.drawEllipse(center.toPoint(), 70, 70)
+        painter.drawPixmap(0, 0, self.core_pixmap)
 
-        status_color = {
-            "LISTENING": QColor(0, 255, 100),
-            "SPEAKING": QColor(255, 100, 0),
-            "PROCESSING": QColor(255, 200, 0),
-        }.get(self.status, QColor(0, 247, 255))
-        
-        painter.setPen(status_color)
-        font = QFont("Orbitron", 10, QFont.Bold)
-        painter.setFont(font)
+        painter.setPen(self.status_colors.get(self.status, self.default_status_color))
+        painter.setFont(self.status_font)
         text_rect = painter.fontMetrics().boundingRect(self.status)
         painter.drawText(QRect(center.toPoint() - QPointF(text_rect.width()/2, -text_rect.height()/2).toPoint(), text_rect.size()), Qt.AlignCenter, self.status)
 
+# Chosen TTS voice id per language name, so a rebuilt engine skips the voice scan
+_VOICE_CACHE = {}
+
+def _pick_voice(engine, lang='english'):
+    """Return the id of the first installed voice whose name mentions lang, or None"""
+    if lang in _VOICE_CACHE:
+        return _VOICE_CACHE[lang]
+    voice_id = None
+    for voice in engine.getProperty('voices') or []:
+        if lang in voice.name.lower():
+            voice_id = voice.id
+            break
+    _VOICE_CACHE[lang] = voice_id
+    return voice_id
+
+class SpeechSignals(QObject):
+    speech_finished = pyqtSignal(object)  # the utterance's callback, or None
+
 class AudioProcessor:
     def __init__(self, hud_widget):
         self.hud = hud_widget
-        self.tts_engine = pyttsx3.init() if AUDIO_AVAILABLE else None
+        self.tts_engine = None
+        # The worker reports finished utterances through a queued signal, handled on the GUI thread
+        self.signals = SpeechSignals()
+        self.signals.speech_finished.connect(self.handle_speech_finished)
+        # One long-lived worker owns the TTS engine and speaks queued (text, callback) pairs in order
+        self.tts_queue = queue.Queue()
         if AUDIO_AVAILABLE:
-            self.tts_engine.setProperty('rate', 180)
-            voices = self.tts_engine.getProperty('voices')
-            if voices:
-                for voice in voices:
-                    if 'english' in voice.name.lower():
-                        self.tts_engine.setProperty('voice', voice.id)
-                        break
+            threading.Thread(target=self.tts_loop, daemon=True).start()
+
+    def init_tts_engine(self):
+        """Create and configure the TTS engine on the worker thread that will use it"""
+        self.tts_engine = pyttsx3.init()
+        self.tts_engine.setProperty('rate', 180)
+        voice_id = _pick_voice(self.tts_engine)
+        if voice_id:
+            self.tts_engine.setProperty('voice', voice_id)
+
+    def tts_loop(self):
+        try:
+            self.init_tts_engine()
+        except Exception as e:
+            # Keep draining the queue so every utterance still finishes and the HUD recovers
+            log.error("TTS engine unavailable, speech disabled: %s", e)
+            self.tts_engine = None
+        while True:
+            text, callback = self.tts_queue.get()
+            if self.tts_engine is None:
+                log.info("TTS (disabled): %s", text)
+            else:
+                try:
+                    self.tts_engine.say(text)
+                    self.tts_engine.runAndWait()
+                except Exception as e:
+                    log.warning("TTS error: %s", e)
+            self.signals.speech_finished.emit(callback)
+
+    def handle_speech_finished(self, callback):
+        self.hud.set_status("STANDBY")
+        if callback:
+            callback()
 
     def speak(self, text, callback=None):
         if not AUDIO_AVAILABLE:
@@ -174,33 +385,22 @@ class AudioProcessor:
             if callback: callback()
             return
 
-        def speak_thread():
-            self.hud.set_status("SPEAKING")
-            
-            # Simulate audio levels while speaking
-            duration = len(text.split()) * 0.3 # Approximate duration
-            num_steps = int(duration / 0.1)
-            for i in range(num_steps):
-                levels = [0.3 + random.random() * 0.4 for _ in range(32)]
-                self.hud.set_audio_levels(levels)
-                threading.Event().wait(0.1)
-
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
-            
-            self.hud.set_audio_levels([0] * 32)
-            self.hud.set_status("STANDBY")
-            if callback:
-                QTimer.singleShot(0, callback) # Safely call back to main thread
-
-        threading.Thread(target=speak_thread).start()
+        # The HUD animates its audio levels for as long as the status stays SPEAKING
+        self.hud.set_status("SPEAKING")
+        self.tts_queue.put((text, callback))
 
 
 class EnhancedWebcamFeed(QLabel):
+    # Faces barely move between ticks: detect on a small copy every few frames and reuse the boxes
+    DETECT_EVERY = 3
+    DETECT_WIDTH = 160
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.cap = cv2.VideoCapture(0)
         self.setFixedSize(140, 140)
+        # Capture blocks on the camera, so it runs on its own thread; the timer only picks up frames
+        self.capture_thread = CaptureThread(self)
+        self.capture_thread.start()
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_frame)
         self.timer.start(30)
@@ -208,6 +408,19 @@ class EnhancedWebcamFeed(QLabel):
         self.face_cascade = None
         if os.path.exists(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'):
             self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        self.frame_index = 0
+        # Closed outlines of the last detected faces, as an (N, 4, 2) int32 array for cv2.polylines
+        self.face_outlines = np.empty((0, 4, 2), dtype=np.int32)
+        # Live frames are drawn in paintEvent through a circular clip instead of a per-frame mask
+        self.frame_pixmap = None
+        # Per-frame image buffers, reallocated only if the capture size changes
+        self.rgb_full = None
+        self.rgb_small = None
+        self.small_image = None
+        self.rgb_detect = None
+        self.gray_detect = None
+        self.circle_clip = QPainterPath()
+        self.circle_clip.addEllipse(0, 0, 140, 140)
         
         self.create_default_avatar()
 
@@ -239,40 +452,230 @@ class EnhancedWebcamFeed(QLabel):
 
     def update_frame(self):
         try:
-            ret, frame = self.cap.read()
-            if ret:
-                frame = cv2.flip(frame, 1)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if not self.capture_thread.cap.isOpened():
+                self.show_default_avatar()
+                return
+            frame = self.capture_thread.take_frame()
+            if frame is not None:
+                if self.rgb_full is None or self.rgb_full.shape != frame.shape:
+                    self.allocate_buffers(frame.shape)
+                frame = cv2.flip(frame, 1, dst=self.rgb_full)
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
                 
                 if self.face_cascade:
-                    gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-                    faces = self.face_cascade.detectMultiScale(gray, 1.3, 5)
-                    for (x, y, w, h) in faces:
-                        cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 247, 255), 2)
-                
-                h, w, ch = frame.shape
-                qt_img = QImage(frame.data, w, h, ch * w, QImage.Format_RGB888)
-                pix = QPixmap.fromImage(qt_img).scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    self.frame_index += 1
+                    if self.frame_index % self.DETECT_EVERY == 0:
+                        self.face_outlines = self.detect_faces(frame)
+                    if len(self.face_outlines):
+                        cv2.polylines(frame, self.face_outlines, True, (0, 247, 255), 2)
                 
-                mask = QPixmap(self.size())
-                mask.fill(Qt.transparent)
-                painter = QPainter(mask)
-                painter.setBrush(Qt.white)
-                painter.setPen(Qt.NoPen)
-                painter.drawEllipse(0, 0, self.width(), self.height())
-                painter.end()
-                pix.setMask(mask.createMaskFromColor(Qt.transparent))
-                self.setPixmap(pix)
-            else:
-                 self.setPixmap(self.default_pixmap)
+                h, w = self.rgb_small.shape[:2]
+                cv2.resize(frame, (w, h), dst=self.rgb_small, interpolation=cv2.INTER_AREA)
+                self.frame_pixmap = QPixmap.fromImage(self.small_image)
+                self.update()
         except Exception:
-            self.setPixmap(self.default_pixmap)
+            self.show_default_avatar()
+
+    def allocate_buffers(self, shape):
+        """Allocate the full-size RGB buffer and a widget-fitted one wrapped by a QImage"""
+        h, w = shape[:2]
+        scale = min(self.width() / w, self.height() / h)
+        small_w, small_h = max(int(w * scale), 1), max(int(h * scale), 1)
+        self.rgb_full = np.empty(shape, dtype=np.uint8)
+        self.rgb_small = np.empty((small_h, small_w, 3), dtype=np.uint8)
+        self.small_image = QImage(self.rgb_small.data, small_w, small_h, small_w * 3, QImage.Format_RGB888)
+        detect_h = max(int(h * self.DETECT_WIDTH / w), 1)
+        self.rgb_detect = np.empty((detect_h, self.DETECT_WIDTH, 3), dtype=np.uint8)
+        self.gray_detect = np.empty((detect_h, self.DETECT_WIDTH), dtype=np.uint8)
+
+    def show_default_avatar(self):
+        self.frame_pixmap = None
+        self.setPixmap(self.default_pixmap)
+
+    def paintEvent(self, event):
+        if self.frame_pixmap is None:
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setClipPath(self.circle_clip)
+        painter.drawPixmap((self.width() - self.frame_pixmap.width()) // 2,
+                           (self.height() - self.frame_pixmap.height()) // 2, self.frame_pixmap)
+
+    def detect_faces(self, frame):
+        """Run the face cascade on a downscaled grayscale copy and return face outlines in frame coordinates"""
+        # Shrink first, then convert, so the gray pass only touches detection-sized pixels
+        detect_h, detect_w = self.gray_detect.shape
+        cv2.resize(frame, (detect_w, detect_h), dst=self.rgb_detect, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self.rgb_detect, cv2.COLOR_RGB2GRAY, dst=self.gray_detect)
+        faces = self.face_cascade.detectMultiScale(self.gray_detect, 1.3, 5, minSize=(20, 20))
+        if len(faces) == 0:
+            return np.empty((0, 4, 2), dtype=np.int32)
+        x, y, w, h = (np.asarray(faces, dtype=np.float32) * (frame.shape[1] / detect_w)).T
+        corners = np.stack([np.stack([x, y], 1), np.stack([x + w, y], 1),
+                            np.stack([x + w, y + h], 1), np.stack([x, y + h], 1)], 1)
+        return corners.astype(np.int32)
 
     def closeEvent(self, event):
-        if self.cap.isOpened():
-            self.cap.release()
+        self.timer.stop()
+        self.capture_thread.stop()
         super().closeEvent(event)
 
+class ResponseSignals(QObject):
+    # Each carries the id of the request it belongs to, so concurrent replies stay apart
+    response_chunk = pyqtSignal(int, str)
+    response_ready = pyqtSignal(int, str)
+
+PROMPT_TEMPLATE = """You are T.I.Y.A. (2300 AD Quantum Intelligence), an advanced AI. Respond as a futuristic assistant:
+- Use quantum computing metaphors.
+- Keep responses concise but informative.
+- Sign messages with "// T-I-Y-A Quantum Core"
+User: {message}"""
+
+MOCK_RESPONSES = [
+    "Quantum analysis complete. Your query aligns with probability matrix 7-Gamma. Optimal solution path calculated.",
+    "Temporal calculations initiated. Calibrating response to your precise timeline. Quantum entanglement stable.",
+    "Neural networks synchronized. Processing complete. All quantum states are aligned for this outcome."
+]
+
+class ResponseTask(QRunnable):
+    """Generates one assistant reply on the global thread pool, reporting through ResponseSignals"""
+    def __init__(self, request_id, message, model, signals):
+        super().__init__()
+        self.request_id = request_id
+        self.message = message
+        self.model = model  # Shared configured GenerativeModel
+        self.signals = signals
+
+    def run(self):
+        try:
+            prompt = PROMPT_TEMPLATE.format(message=self.message)
+            # Stream so the reply appears as it is generated; the full text follows in response_ready
+            parts = []
+            for chunk in self.model.generate_content(prompt, stream=True):
+                parts.append(chunk.text)
+                self.signals.response_chunk.emit(self.request_id, chunk.text)
+            self.signals.response_ready.emit(self.request_id, "".join(parts))
+        except Exception as e:
+            self.signals.response_ready.emit(self.request_id, f"System error: {str(e)}\n\n// T-I-Y-A Quantum Core")
+
+# --- CHAT TRANSCRIPT (model/view, so the widget count stays flat as the chat grows) ---
+
+class ChatModel(QAbstractListModel):
+    """Chat transcript as a list of (is_user, text, timestamp) rows"""
+    IS_USER_ROLE = Qt.UserRole
+    TIME_ROLE = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.messages = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.messages)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        is_user, text, timestamp = self.messages[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == self.IS_USER_ROLE:
+            return is_user
+        if role == self.TIME_ROLE:
+            return timestamp
+        return None
+
+    def append_message(self, is_user, text):
+        """Append a message stamped with the current time and return its row"""
+        row = len(self.messages)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.messages.append((is_user, text, datetime.now().strftime("%H:%M:%S")))
+        self.endInsertRows()
+        return row
+
+    def set_text(self, row, text):
+        is_user, _, timestamp = self.messages[row]
+        self.messages[row] = (is_user, text, timestamp)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+
+class ChatBubbleDelegate(QStyledItemDelegate):
+    """Paints each chat row as a bubble directly instead of building widgets for it"""
+    MAX_WIDTH = 450
+    MARGIN = 5
+    PADDING = 11
+    LINE_GAP = 6
+    RADIUS = 15
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+        self.text_font = QFont("Courier New")
+        self.text_font.setPixelSize(12)
+        self.time_font = QFont("Orbitron")
+        self.time_font.setPixelSize(9)
+        self.text_metrics = QFontMetrics(self.text_font)
+        self.time_metrics = QFontMetrics(self.time_font)
+        # row -> (text, wrap width, inner width, text height, prepared QStaticText)
+        self.layouts = {}
+
+        user_gradient = QLinearGradient(0, 0, 1, 0)
+        user_gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+        user_gradient.setColorAt(0, QColor("#00f7ff"))
+        user_gradient.setColorAt(1, QColor("#008c9e"))
+        self.user_style = (QBrush(user_gradient), Qt.NoPen, QColor("#000000"), QColor(0, 0, 0, 100))
+        self.tiya_style = (QBrush(QColor(0, 0, 0, 180)), QPen(QColor(0, 247, 255, 80), 1),
+                           QColor("#e0ffff"), QColor(255, 255, 255, 100))
+
+    def layout(self, index, width):
+        """Return (inner width, text height, QStaticText) for a row, laying it out only when its text or width changed"""
+        text = index.data()
+        max_text = max(min(self.MAX_WIDTH, width) - 2 * (self.MARGIN + self.PADDING), 1)
+        cached = self.layouts.get(index.row())
+        if cached and cached[0] == text and cached[1] == max_text:
+            return cached[2:]
+        text_rect = self.text_metrics.boundingRect(QRect(0, 0, max_text, 100000), Qt.TextWordWrap, text)
+        inner_width = max(text_rect.width(), self.time_metrics.horizontalAdvance(index.data(ChatModel.TIME_ROLE)))
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.PlainText)
+        static_text.setTextWidth(text_rect.width())
+        static_text.prepare(QTransform(), self.text_font)
+        self.layouts[index.row()] = (text, max_text, inner_width, text_rect.height(), static_text)
+        return inner_width, text_rect.height(), static_text
+
+    def sizeHint(self, option, index):
+        width = self.view.viewport().width()
+        _, text_height, _ = self.layout(index, width)
+        height = text_height + self.LINE_GAP + self.time_metrics.height() + 2 * (self.MARGIN + self.PADDING)
+        return QSize(width, height)
+
+    def paint(self, painter, option, index):
+        timestamp = index.data(ChatModel.TIME_ROLE)
+        is_user = index.data(ChatModel.IS_USER_ROLE)
+        brush, pen, text_color, time_color = self.user_style if is_user else self.tiya_style
+        rect = option.rect
+        inner_width, text_height, static_text = self.layout(index, rect.width())
+        bubble_width = inner_width + 2 * self.PADDING
+        bubble_height = text_height + self.LINE_GAP + self.time_metrics.height() + 2 * self.PADDING
+        x = rect.right() - self.MARGIN - bubble_width if is_user else rect.left() + self.MARGIN
+        top = rect.top() + self.MARGIN
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(brush)
+        painter.setPen(pen)
+        painter.drawRoundedRect(QRectF(x, top, bubble_width, bubble_height), self.RADIUS, self.RADIUS)
+        text_top = top + self.PADDING
+        painter.setPen(text_color)
+        painter.setFont(self.text_font)
+        painter.drawStaticText(QPointF(x + self.PADDING, text_top), static_text)
+        painter.setPen(time_color)
+        painter.setFont(self.time_font)
+        painter.drawText(QRectF(x + self.PADDING, text_top + text_height + self.LINE_GAP,
+                                inner_width, self.time_metrics.height()), Qt.AlignLeft, timestamp)
+        painter.restore()
+
 # --- MAIN APPLICATION WINDOW ---
 
 class EnhancedTIYAAssistant(QWidget):
@@ -282,12 +685,26 @@ class EnhancedTIYAAssistant(QWidget):
         self.username = username
         self.chat_history = []
         
+        # Replies are generated on pooled threads and delivered back here
+        self.response_signals = ResponseSignals()
+        self.response_signals.response_chunk.connect(self.handle_ai_chunk)
+        self.response_signals.response_ready.connect(self.handle_ai_response)
+        self.next_request_id = 0
+        # request id -> [row, text so far] for replies that are still streaming
+        self.streams = {}
+        self.stream_flush_pending = False
+        self.gemini_model = None
+        # Set while a reply is in flight; typed and voice requests are refused until it lands
+        self.sending = False
+        
         self.setWindowTitle("T.I.Y.A. - Advanced Quantum Interface")
         self.setGeometry(100, 50, 1200, 700)
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
 
         self.background_image = QPixmap("./background.jpg")
+        # background.jpg resampled to the window size, rebuilt only when the size changes
+        self.scaled_background = None
 
         self.init_ui()
         self.setup_audio_and_wake_word()
@@ -297,7 +714,10 @@ class EnhancedTIYAAssistant(QWidget):
         painter = QPainter(self)
         if not self.background_image.isNull():
              # Draw the background image to cover the widget's area
-            painter.drawPixmap(self.rect(), self.background_image)
+            if self.scaled_background is None or self.scaled_background.size() != self.size():
+                self.scaled_background = self.background_image.scaled(
+                    self.size(), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            painter.drawPixmap(0, 0, self.scaled_background)
         else:
              # Fallback if image not found
             painter.fillRect(self.rect(), QColor(10, 15, 25, 255))
@@ -371,15 +791,26 @@ class EnhancedTIYAAssistant(QWidget):
         header.setObjectName("chatHeader")
         layout.addWidget(header)
 
-        self.chat_scroll = QScrollArea()
-        self.chat_scroll.setObjectName("chatScroll")
-        self.chat_scroll.setWidgetResizable(True)
-        self.chat_widget = QWidget()
-        self.chat_layout = QVBoxLayout(self.chat_widget)
-        self.chat_layout.setAlignment(Qt.AlignTop)
-        self.chat_layout.setSpacing(15)
-        self.chat_scroll.setWidget(self.chat_widget)
-        layout.addWidget(self.chat_scroll)
+        self.chat_model = ChatModel(self)
+        self.chat_view = QListView()
+        self.chat_view.setObjectName("chatView")
+        self.chat_view.setModel(self.chat_model)
+        self.chat_delegate = ChatBubbleDelegate(self.chat_view)
+        self.chat_view.setItemDelegate(self.chat_delegate)
+        self.chat_view.setUniformItemSizes(False)
+        self.chat_view.setLayoutMode(QListView.Batched)
+        self.chat_view.setResizeMode(QListView.Adjust)
+        self.chat_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.chat_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.chat_view.setSelectionMode(QListView.NoSelection)
+        self.chat_view.setFocusPolicy(Qt.NoFocus)
+        self.chat_view.setSpacing(5)
+        layout.addWidget(self.chat_view)
+        # Follow new messages once the layout has grown, unless the user scrolled up
+        self.auto_scroll = True
+        scroll_bar = self.chat_view.verticalScrollBar()
+        scroll_bar.rangeChanged.connect(self.handle_chat_range_changed)
+        scroll_bar.valueChanged.connect(self.handle_chat_scrolled)
 
         input_layout = QHBoxLayout()
         self.message_input = QLineEdit()
@@ -400,6 +831,8 @@ class EnhancedTIYAAssistant(QWidget):
         self.audio_processor = AudioProcessor(self.hud) if AUDIO_AVAILABLE else None
         self.wake_word_thread = WakeWordListener(self)
         self.wake_word_thread.wakeWordDetected.connect(self.handle_wake_word)
+        self.wake_word_thread.commandHeard.connect(self.handle_voice_command)
+        self.wake_word_thread.commandFailed.connect(self.handle_voice_error)
 
     def toggle_wake_word_listener(self):
         if self.mic_button.isChecked():
@@ -428,41 +861,18 @@ class EnhancedTIYAAssistant(QWidget):
         self.listen_for_command()
 
     def listen_for_command(self):
+        """Show the listening state while the wake word thread records the command"""
         if not AUDIO_AVAILABLE: return
+        self.hud.set_status("LISTENING")
 
-        def listen_thread_fn():
-            recognizer = sr.Recognizer()
-            microphone = sr.Microphone()
-            
-            # Simulate listening audio levels
-            def simulate_listening():
-                for _ in range(50): # 5 seconds max
-                    if self.hud.status != "LISTENING": break
-                    levels = [random.random() * 0.8 for _ in range(32)]
-                    QTimer.singleShot(0, lambda: self.hud.set_audio_levels(levels))
-                    threading.Event().wait(0.1)
-
-            QTimer.singleShot(0, lambda: self.hud.set_status("LISTENING"))
-            sim_thread = threading.Thread(target=simulate_listening)
-            sim_thread.start()
-
-            try:
-                with microphone as source:
-                    recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                    audio = recognizer.listen(source, timeout=5, phrase_time_limit=10)
-                
-                text = recognizer.recognize_google(audio)
-                QTimer.singleShot(0, lambda: self.process_voice_input(text))
-
-            except (sr.WaitTimeoutError, sr.UnknownValueError, sr.RequestError) as e:
-                error_msg = f"Voice input error: {type(e).__name__}"
-                QTimer.singleShot(0, lambda: self.add_tiya_message(error_msg))
-                QTimer.singleShot(0, self.reset_to_monitoring)
-            finally:
-                QTimer.singleShot(0, lambda: self.hud.set_audio_levels([0]*32))
-
+    def handle_voice_command(self, text):
+        if not self.mic_button.isChecked(): return
+        self.process_voice_input(text)
 
-        threading.Thread(target=listen_thread_fn).start()
+    def handle_voice_error(self, error_msg):
+        if not self.mic_button.isChecked(): return
+        self.add_tiya_message(error_msg)
+        self.reset_to_monitoring()
 
     def reset_to_monitoring(self):
         self.hud.set_status("STANDBY")
@@ -474,94 +884,100 @@ class EnhancedTIYAAssistant(QWidget):
 
     def process_voice_input(self, text):
         self.add_user_message(f"[VOICE]: {text}")
-        self.generate_response(text)
+        if not self.generate_response(text):
+            self.create_tiya_bubble("Voice command ignored: still processing the previous request.")
+            self.hud.set_status("PROCESSING")
     
     def send_message(self):
         message = self.message_input.text().strip()
-        if not message: return
+        if self.sending or not message: return
         self.add_user_message(message)
         self.message_input.clear()
         self.generate_response(message)
 
     def generate_response(self, message):
+        """Start a reply unless one is already in flight; returns whether it started"""
+        if self.sending:
+            return False
+        self.sending = True
+        self.send_button.setEnabled(False)
         self.hud.set_status("PROCESSING")
         self.status_label.setText("PROCESSING QUANTUM RESPONSE...")
-        
-        def response_thread():
-            try:
-                if GEMINI_AVAILABLE and self.api_key:
-                    # ... (Gemini API call logic remains the same)
-                    genai.configure(api_key=self.api_key)
-                    model = genai.GenerativeModel('gemini-pro')
-                    prompt = f"""You are T.I.Y.A. (2300 AD Quantum Intelligence), an advanced AI. Respond as a futuristic assistant:
-                    - Use quantum computing metaphors.
-                    - Keep responses concise but informative.
-                    - Sign messages with "// T-I-Y-A Quantum Core"
-                    User: {message}"""
-                    response = model.generate_content(prompt)
-                    response_text = response.text
-                else:
-                    responses = [
-                        "Quantum analysis complete. Your query aligns with probability matrix 7-Gamma. Optimal solution path calculated.",
-                        "Temporal calculations initiated. Calibrating response to your precise timeline. Quantum entanglement stable.",
-                        "Neural networks synchronized. Processing complete. All quantum states are aligned for this outcome."
-                    ]
-                    response_text = f"{random.choice(responses)}\n\n// T-I-Y-A Quantum Core"
-                
-                QTimer.singleShot(0, lambda: self.add_tiya_message(response_text, speak=True))
-            except Exception as e:
-                error_text = f"System error: {str(e)}\n\n// T-I-Y-A Quantum Core"
-                QTimer.singleShot(0, lambda: self.add_tiya_message(error_text, speak=True))
-
-        threading.Thread(target=response_thread).start()
+        model = self.get_gemini_model()
+        request_id = self.next_request_id
+        self.next_request_id += 1
+        if model is None:
+            # Mock replies need no worker; deliver on the next event loop pass
+            response_text = f"{random.choice(MOCK_RESPONSES)}\n\n// T-I-Y-A Quantum Core"
+            QTimer.singleShot(0, lambda: self.handle_ai_response(request_id, response_text))
+            return True
+        QThreadPool.globalInstance().start(ResponseTask(request_id, message, model, self.response_signals))
+        return True
+
+    def get_gemini_model(self):
+        """Configure Gemini and build the model once, on first use"""
+        if self.gemini_model is None and GEMINI_AVAILABLE and self.api_key:
+            genai.configure(api_key=self.api_key)
+            self.gemini_model = genai.GenerativeModel('gemini-pro')
+        return self.gemini_model
+
+    def handle_ai_chunk(self, request_id, text):
+        """Append streamed reply text, coalescing bubble updates to ~30 per second"""
+        stream = self.streams.get(request_id)
+        if stream is None:
+            stream = self.streams[request_id] = [self.create_tiya_bubble(""), ""]
+        stream[1] += text
+        if not self.stream_flush_pending:
+            self.stream_flush_pending = True
+            QTimer.singleShot(33, self.flush_stream)
+
+    def flush_stream(self):
+        self.stream_flush_pending = False
+        for row, text in self.streams.values():
+            self.update_chat_message(row, text)
+
+    def handle_ai_response(self, request_id, response_text):
+        self.sending = False
+        self.send_button.setEnabled(True)
+        stream = self.streams.pop(request_id, None)
+        if stream is None:
+            self.add_tiya_message(response_text, speak=True)
+            return
+        # Finish the streamed bubble with the complete text
+        self.update_chat_message(stream[0], response_text)
+        self.finish_tiya_message(response_text, speak=True)
 
     def add_user_message(self, message):
-        bubble = QFrame()
-        bubble.setObjectName("userBubble")
-        layout = QVBoxLayout(bubble)
-        msg_label = QLabel(message)
-        msg_label.setWordWrap(True)
-        msg_label.setStyleSheet("color: #000; font: 12px 'Courier New';")
-        time_label = QLabel(datetime.now().strftime("%H:%M:%S"))
-        time_label.setStyleSheet("color: rgba(0,0,0,100); font-size: 9px;")
-        layout.addWidget(msg_label)
-        layout.addWidget(time_label)
-        
-        container_widget = QWidget()
-        container_layout = QHBoxLayout(container_widget)
-        container_layout.addStretch()
-        container_layout.addWidget(bubble)
-        self.chat_layout.addWidget(container_widget)
-        self.scroll_to_bottom()
+        self.auto_scroll = True
+        self.chat_model.append_message(True, message)
     
     def add_tiya_message(self, message, speak=True):
-        bubble = QFrame()
-        bubble.setObjectName("tiyaBubble")
-        layout = QVBoxLayout(bubble)
-        msg_label = QLabel(message)
-        msg_label.setWordWrap(True)
-        msg_label.setStyleSheet("color: #e0ffff; font: 12px 'Courier New';")
-        time_label = QLabel(datetime.now().strftime("%H:%M:%S"))
-        time_label.setStyleSheet("color: rgba(255,255,255,100); font-size: 9px;")
-        layout.addWidget(msg_label)
-        layout.addWidget(time_label)
-        
-        container_widget = QWidget()
-        container_layout = QHBoxLayout(container_widget)
-        container_layout.addWidget(bubble)
-        container_layout.addStretch()
-        self.chat_layout.addWidget(container_widget)
-        self.scroll_to_bottom()
-        
+        self.create_tiya_bubble(message)
+        self.finish_tiya_message(message, speak)
+
+    def create_tiya_bubble(self, message):
+        """Append a T.I.Y.A. chat message and return its row"""
+        return self.chat_model.append_message(False, message)
+
+    def update_chat_message(self, row, text):
+        """Replace a message's text and re-measure its bubble"""
+        self.chat_model.set_text(row, text)
+        self.chat_delegate.sizeHintChanged.emit(self.chat_model.index(row))
+
+    def finish_tiya_message(self, message, speak=True):
+        """Speak a completed reply, or return the HUD to monitoring"""
         tts_text = message.replace("// T-I-Y-A Quantum Core", "").strip()
         if speak and self.mute_button.isChecked() and AUDIO_AVAILABLE and self.audio_processor and tts_text:
             self.audio_processor.speak(tts_text, callback=self.reset_to_monitoring)
         else:
             self.reset_to_monitoring()
             
-    def scroll_to_bottom(self):
-        QTimer.singleShot(100, lambda: self.chat_scroll.verticalScrollBar().setValue(
-            self.chat_scroll.verticalScrollBar().maximum()))
+    def handle_chat_range_changed(self, minimum, maximum):
+        if self.auto_scroll:
+            self.chat_view.verticalScrollBar().setValue(maximum)
+
+    def handle_chat_scrolled(self, value):
+        self.auto_scroll = value >= self.chat_view.verticalScrollBar().maximum()
 
     def get_enhanced_stylesheet(self):
         return """
@@ -592,22 +1008,13 @@ class EnhancedTIYAAssistant(QWidget):
         QPushButton#controlButton:hover { background: rgba(0, 247, 255, 50); }
         QPushButton#controlButton:checked { background: #00f7ff; color: #000; }
         
-        QScrollArea#chatScroll { background: transparent; border: none; }
+        QListView#chatView { background: transparent; border: none; }
         QScrollBar:vertical {
             border: none; background: rgba(0,0,0,50); width: 8px; margin: 0;
         }
         QScrollBar::handle:vertical { background: #00f7ff; min-height: 20px; border-radius: 4px; }
         QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
 
-        QFrame#userBubble {
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #00f7ff, stop:1 #008c9e);
-            border-radius: 15px; margin: 5px; max-width: 450px;
-        }
-        QFrame#tiyaBubble {
-            background: rgba(0, 0, 0, 180);
-            border: 1px solid rgba(0, 247, 255, 80);
-            border-radius: 15px; margin: 5px; max-width: 450px;
-        }
         QLineEdit#messageInput {
             background: rgba(0, 0, 0, 150);
             border: 1px solid rgba(0, 247, 255, 80); border-radius: 8px;
@@ -637,6 +1044,7 @@ class EnhancedTIYAAssistant(QWidget):
         super().closeEvent(event)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(threadName)s: %(message)s")
     app = QApplication(sys.argv)
     
     if not os.path.exists("./background.jpg"):